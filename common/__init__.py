@@ -0,0 +1,3 @@
+from .frontmatter import parse_frontmatter, read_frontmatter, split_frontmatter
+
+__all__ = ["parse_frontmatter", "read_frontmatter", "split_frontmatter"]
@@ -0,0 +1,41 @@
+"""
+Content hashing for dropped files.
+
+hash_file() streams a file through SHA-256 in fixed-size chunks, so memory
+use does not grow with the file. Files of MMAP_THRESHOLD bytes or more are
+memory-mapped and hashed straight from the page cache instead, which skips
+copying every chunk into a Python buffer. hashlib releases the GIL while it
+works, so hashing on a worker thread does not stall the caller.
+"""
+
+import hashlib
+import mmap
+import os
+from pathlib import Path
+
+HASH_CHUNK = 1024 * 1024  # bytes per read when streaming
+MMAP_THRESHOLD = 64 * 1024 * 1024  # files at least this large are memory-mapped
+
+
+def hash_file(file_path: Path) -> tuple[str, int]:
+    """Return (sha256 hex digest, size in bytes) of a file's content."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    for start in range(0, len(view), MMAP_THRESHOLD):
+                        digest.update(view[start:start + MMAP_THRESHOLD])
+                finally:
+                    view.release()
+            return digest.hexdigest(), size
+
+        buf = bytearray(HASH_CHUNK)
+        view = memoryview(buf)
+        size = 0
+        while n := f.readinto(buf):
+            digest.update(view[:n])
+            size += n
+    return digest.hexdigest(), size
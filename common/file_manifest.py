@@ -0,0 +1,180 @@
+"""
+Persistent manifest of files already picked up from the drop folders.
+
+Entries record (size, mtime, inode) per file, grouped by directory, so a
+rescan can compare a directory listing with what was recorded without
+stat-ing every file: os.scandir() reports each entry's inode for free, and
+a name whose inode matches the manifest is skipped. Only new or replaced
+files cost a stat call.
+
+Directory mtimes are recorded too. A directory's mtime changes whenever an
+entry is added, removed or renamed in it, so a directory whose mtime is
+unchanged is not listed again at all. Like the processed ID store, changes
+are buffered and written to sqlite in one transaction by flush().
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+# A directory modified this recently may still change within the same mtime
+# tick, so its mtime is not trusted to skip the next listing
+RACY_SECONDS = 1.0
+
+
+class FileManifest:
+    """Files and directories seen in the watched trees."""
+
+    def __init__(self, db_path: Path, readonly: bool = False):
+        """With readonly, changes are kept in memory and never written (dry runs)."""
+        self.db_path = Path(db_path)
+        self.readonly = readonly
+        self._lock = threading.Lock()
+        self._files: dict[str, dict[str, tuple[int, int, int]]] = {}
+        self._dirs: dict[str, int | None] = {}
+        self._children: dict[str, set[str]] = {}
+        self._changed_files: dict[tuple[str, str], tuple[int, int, int] | None] = {}
+        self._changed_dirs: dict[str, int | None | bool] = {}  # False: deleted
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            " dir TEXT NOT NULL,"
+            " name TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " mtime_ns INTEGER NOT NULL,"
+            " inode INTEGER NOT NULL,"
+            " PRIMARY KEY (dir, name)"
+            ") WITHOUT ROWID"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS dirs ("
+            " path TEXT PRIMARY KEY,"
+            " mtime_ns INTEGER"
+            ") WITHOUT ROWID"
+        )
+        self._conn.commit()
+
+        for dir_path, name, size, mtime_ns, inode in self._conn.execute("SELECT * FROM files"):
+            self._files.setdefault(dir_path, {})[name] = (size, mtime_ns, inode)
+        for path, mtime_ns in self._conn.execute("SELECT path, mtime_ns FROM dirs"):
+            self._dirs[path] = mtime_ns
+            self._children.setdefault(os.path.dirname(path), set()).add(path)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(names) for names in self._files.values())
+
+    @property
+    def empty(self) -> bool:
+        """True until anything has been recorded (e.g. on the first run)."""
+        with self._lock:
+            return not self._files and not self._dirs
+
+    def seen(self, dir_path: str, name: str, inode: int) -> bool:
+        """Whether this file (same name and inode) was already picked up."""
+        with self._lock:
+            entry = self._files.get(dir_path, {}).get(name)
+        return entry is not None and entry[2] == inode
+
+    def record(self, file_path: Path, st: os.stat_result | None = None) -> bool:
+        """Record a file as picked up; returns False if it no longer exists."""
+        if st is None:
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                return False
+        dir_path, name = os.path.split(str(file_path))
+        entry = (st.st_size, st.st_mtime_ns, st.st_ino)
+        with self._lock:
+            self._files.setdefault(dir_path, {})[name] = entry
+            self._changed_files[(dir_path, name)] = entry
+        return True
+
+    def forget(self, file_path: Path):
+        """Drop a deleted or moved-away file."""
+        dir_path, name = os.path.split(str(file_path))
+        with self._lock:
+            names = self._files.get(dir_path)
+            if names is not None and names.pop(name, None) is not None:
+                self._changed_files[(dir_path, name)] = None
+
+    def names(self, dir_path: str) -> set[str]:
+        """Names recorded in a directory."""
+        with self._lock:
+            return set(self._files.get(dir_path, ()))
+
+    def dir_unchanged(self, dir_path: str, mtime_ns: int) -> bool:
+        """Whether a directory still has the mtime recorded at its last listing."""
+        with self._lock:
+            recorded = self._dirs.get(dir_path)
+        return recorded is not None and recorded == mtime_ns
+
+    def record_dir(self, dir_path: str, mtime_ns: int | None):
+        """
+        Remember a directory's mtime after listing it in full.
+
+        None records the directory without an mtime, so it is listed again
+        next time.
+        """
+        if mtime_ns is not None and time.time_ns() - mtime_ns < RACY_SECONDS * 1e9:
+            mtime_ns = None  # too fresh to trust; list it again next time
+        with self._lock:
+            if self._dirs.get(dir_path, 0) != mtime_ns:
+                self._dirs[dir_path] = mtime_ns
+                self._changed_dirs[dir_path] = mtime_ns
+                self._children.setdefault(os.path.dirname(dir_path), set()).add(dir_path)
+
+    def subdirs(self, dir_path: str) -> list[str]:
+        """Recorded directories directly inside dir_path."""
+        with self._lock:
+            return list(self._children.get(dir_path, ()))
+
+    def forget_dir(self, dir_path: str):
+        """Drop a directory that no longer exists, with everything recorded under it."""
+        prefix = dir_path + os.sep
+        with self._lock:
+            for path in [p for p in self._dirs if p == dir_path or p.startswith(prefix)]:
+                del self._dirs[path]
+                self._changed_dirs[path] = False
+                self._children.pop(path, None)
+            self._children.get(os.path.dirname(dir_path), set()).discard(dir_path)
+            for path in [p for p in self._files if p == dir_path or p.startswith(prefix)]:
+                for name in self._files.pop(path):
+                    self._changed_files[(path, name)] = None
+
+    def flush(self):
+        """Write buffered changes in one transaction."""
+        with self._lock:
+            if self.readonly or (not self._changed_files and not self._changed_dirs):
+                return
+            with self._conn:
+                for (dir_path, name), entry in self._changed_files.items():
+                    if entry is None:
+                        self._conn.execute(
+                            "DELETE FROM files WHERE dir = ? AND name = ?", (dir_path, name)
+                        )
+                    else:
+                        self._conn.execute(
+                            "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?)",
+                            (dir_path, name, *entry),
+                        )
+                for path, mtime_ns in self._changed_dirs.items():
+                    if mtime_ns is False:
+                        self._conn.execute("DELETE FROM dirs WHERE path = ?", (path,))
+                    else:
+                        self._conn.execute(
+                            "INSERT OR REPLACE INTO dirs VALUES (?, ?)", (path, mtime_ns)
+                        )
+            self._changed_files.clear()
+            self._changed_dirs.clear()
+
+    def close(self):
+        """Flush pending changes and close the database."""
+        self.flush()
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,194 @@
+"""
+Frontmatter parsing shared by the orchestrator and scripts.
+
+Vault files start with a YAML-style header between two `---` lines. Routing
+decisions only need that header, so read_frontmatter() reads a file line by
+line, stops at the closing delimiter and never loads the body. Parsed headers
+are cached by (path, mtime, size).
+
+Only the subset of YAML the vault uses is understood: `key: value` pairs,
+single/double quoted values, `|` and `>` block scalars, indented
+continuation lines and `- item` lists. Values are returned as strings
+(lists for `- item` blocks), never converted to dates or numbers.
+"""
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+DELIMITER = "---"
+FRONTMATTER_MAX_BYTES = 64 * 1024  # headers larger than this are ignored
+CACHE_SIZE = 4096  # parsed headers kept in memory
+
+_BLOCK_INDICATORS = {"|", "|-", "|+", ">", ">-", ">+"}
+
+_cache: "OrderedDict[Path, tuple[tuple[int, int], dict]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _is_delimiter(line: str) -> bool:
+    return line.rstrip() == DELIMITER
+
+
+def _unquote(value: str) -> str:
+    """Strip matching YAML quotes from a value, decoding their escapes."""
+    if len(value) < 2 or value[0] != value[-1] or value[0] not in "'\"":
+        return value
+
+    inner = value[1:-1]
+    if value[0] == "'":
+        return inner.replace("''", "'")
+
+    escapes = {"n": "\n", "t": "\t", '"': '"', "\\": "\\"}
+    out = []
+    chars = iter(inner)
+    for char in chars:
+        if char == "\\":
+            nxt = next(chars, "")
+            out.append(escapes.get(nxt, "\\" + nxt))
+        else:
+            out.append(char)
+    return "".join(out)
+
+
+def _dedent(lines: list[str]) -> list[str]:
+    indents = [len(line) - len(line.lstrip()) for line in lines if line.strip()]
+    cut = min(indents, default=0)
+    return [line[cut:] for line in lines]
+
+
+def _finish(frontmatter: dict, key: str, style: str, parts: list[str]) -> None:
+    """Store the value collected for key according to its style."""
+    if style == "list":
+        frontmatter[key] = [_unquote(item) for item in parts]
+    elif style.startswith("|"):
+        frontmatter[key] = "\n".join(_dedent(parts)).rstrip("\n")
+    elif style.startswith(">"):
+        folded = []
+        for line in _dedent(parts):
+            if not line.strip():
+                folded.append("\n")
+            elif folded and folded[-1] != "\n":
+                folded.append(" " + line.strip())
+            else:
+                folded.append(line.strip())
+        frontmatter[key] = "".join(folded).rstrip("\n")
+    else:
+        frontmatter[key] = _unquote(" ".join(part for part in parts if part))
+
+
+def _parse_lines(lines) -> dict:
+    """Parse the lines between the two delimiters."""
+    frontmatter: dict = {}
+    key = None
+    style = "plain"
+    parts: list[str] = []
+
+    for line in lines:
+        line = line.rstrip("\r\n")
+        stripped = line.strip()
+
+        # Indented or blank lines continue the current key
+        if line[:1] in (" ", "\t") or not stripped:
+            if key is None:
+                continue
+            if style[0] in "|>":
+                parts.append(line)
+            elif not stripped:
+                continue
+            elif style in ("list", "empty") and (stripped == "-" or stripped.startswith("- ")):
+                style = "list"
+                parts.append(stripped[1:].strip())
+            elif style != "list":
+                style = "plain"
+                parts.append(stripped)
+            continue
+
+        if key is not None:
+            _finish(frontmatter, key, style, parts)
+            key = None
+
+        if stripped.startswith("#") or ":" not in line:
+            continue
+
+        name, value = line.split(":", 1)
+        key = name.strip()
+        value = value.strip()
+        if value in _BLOCK_INDICATORS:
+            style, parts = value, []
+        elif not value:
+            style, parts = "empty", []
+        else:
+            style, parts = "plain", [value]
+
+    if key is not None:
+        _finish(frontmatter, key, style, parts)
+    return frontmatter
+
+
+def split_frontmatter(content: str) -> tuple[dict, str]:
+    """Split markdown content into (frontmatter, body)."""
+    lines = content.split("\n")
+    if not lines or not _is_delimiter(lines[0].lstrip("\ufeff")):
+        return {}, content
+
+    for end in range(1, len(lines)):
+        if _is_delimiter(lines[end]):
+            return _parse_lines(lines[1:end]), "\n".join(lines[end + 1:])
+    return {}, content
+
+
+def parse_frontmatter(content: str) -> dict:
+    """Extract YAML frontmatter from markdown content."""
+    return split_frontmatter(content)[0]
+
+
+def _read_header(path: Path, max_bytes: int) -> dict:
+    """Read and parse only the leading frontmatter block of a file."""
+    with open(path, "rb") as f:
+        first = f.readline(max_bytes)
+        if not _is_delimiter(first.decode("utf-8-sig", errors="replace")):
+            return {}
+
+        budget = max_bytes - len(first)
+        lines = []
+        while budget > 0:
+            raw = f.readline(budget)
+            if not raw:
+                break
+            budget -= len(raw)
+            line = raw.decode("utf-8", errors="replace")
+            if _is_delimiter(line):
+                return _parse_lines(lines)
+            lines.append(line)
+
+    # No closing delimiter within the budget: not a frontmatter block
+    return {}
+
+
+def read_frontmatter(path: Path, max_bytes: int = FRONTMATTER_MAX_BYTES) -> dict:
+    """
+    Read a file's frontmatter without loading its body.
+
+    Results are cached until the file's mtime or size changes.
+    Raises OSError if the file cannot be read.
+    """
+    path = Path(path)
+    st = path.stat()
+    key = (st.st_mtime_ns, st.st_size)
+
+    with _cache_lock:
+        cached = _cache.get(path)
+        if cached is not None and cached[0] == key:
+            _cache.move_to_end(path)
+            return dict(cached[1])
+
+    frontmatter = _read_header(path, max_bytes)
+
+    with _cache_lock:
+        _cache[path] = (key, frontmatter)
+        _cache.move_to_end(path)
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+
+    return dict(frontmatter)
@@ -0,0 +1,318 @@
+"""
+Gmail API helpers shared by the Gmail watcher and the email MCP server.
+
+GmailClient owns the OAuth credentials for a token file: it loads them once,
+refreshes them under a lock and writes the refreshed token back, so callers
+never handle token.json themselves. Services are built from a discovery
+document parsed once per process, one per thread (httplib2 connections are
+not thread-safe), and reused so their HTTP connections stay open. The
+`a*` methods run the same calls on a worker thread for asyncio callers.
+Status messages go to `log` (print by default; stdio servers should send
+them to stderr).
+Use get_client() to share one client per token file within a process.
+
+batch_get_messages() fetches many messages through Gmail's HTTP batch
+endpoint, so a catch-up of N messages costs ceil(N / BATCH_LIMIT) round
+trips instead of N. Rate-limited (429, 403 rateLimitExceeded) and 5xx
+responses can be retried with jittered exponential backoff.
+"""
+
+import asyncio
+import json
+import random
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+API_ROOT = "https://gmail.googleapis.com/gmail/v1"
+DOWNLOAD_CHUNK = 64 * 1024  # bytes read per step when streaming attachments
+BATCH_LIMIT = 50  # Gmail accepts 100 calls per batch but throttles above ~50
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+RATE_LIMIT_REASONS = {"rateLimitExceeded", "userRateLimitExceeded"}
+BACKOFF_BASE = 1.0  # seconds before the first retry
+BACKOFF_MAX = 64.0  # cap on a single retry delay
+
+_discovery_doc: dict | None = None
+_discovery_lock = threading.Lock()
+_clients: dict[Path, "GmailClient"] = {}
+_clients_lock = threading.Lock()
+
+
+class GmailAuthError(RuntimeError):
+    """Raised when no usable Gmail credentials are available."""
+
+
+def is_retryable(error: Exception) -> bool:
+    """Whether a Gmail API error is a transient rate-limit or server failure."""
+    resp = getattr(error, "resp", None)
+    status = getattr(resp, "status", None)
+    if status in RETRY_STATUSES:
+        return True
+    if status == 403:
+        reason = getattr(error, "reason", "") or str(error)
+        return any(r in reason for r in RATE_LIMIT_REASONS)
+    return False
+
+
+def backoff_delay(attempt: int) -> float:
+    """Jittered exponential delay before retry number `attempt` (0-based)."""
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+
+
+def execute_with_backoff(request, retries: int = 5):
+    """Execute a Gmail API request, retrying transient failures."""
+    for attempt in range(retries + 1):
+        try:
+            return request.execute()
+        except Exception as e:
+            if attempt == retries or not is_retryable(e):
+                raise
+            time.sleep(backoff_delay(attempt))
+
+
+def batch_get_messages(
+    service,
+    msg_ids: list[str],
+    format: str = "full",
+    metadata_headers: list[str] | None = None,
+    retries: int = 0,
+) -> tuple[list[dict], dict[str, Exception]]:
+    """
+    Fetch messages by ID using batched requests.
+
+    Returns (messages, errors): messages in the order of msg_ids, skipping
+    any that failed, and a map of failed message ID to its exception. A
+    failure only affects its own message, never the rest of the batch.
+    Messages that fail with a retryable error are re-requested up to
+    `retries` times.
+    """
+    fetched: dict[str, dict] = {}
+    errors: dict[str, Exception] = {}
+
+    def on_response(request_id, response, exception):
+        if exception is not None:
+            errors[request_id] = exception
+        else:
+            errors.pop(request_id, None)
+            fetched[request_id] = response
+
+    msg_ids = list(dict.fromkeys(msg_ids))
+    pending = msg_ids
+    for attempt in range(retries + 1):
+        for start in range(0, len(pending), BATCH_LIMIT):
+            batch = service.new_batch_http_request(callback=on_response)
+            for msg_id in pending[start:start + BATCH_LIMIT]:
+                kwargs = {"userId": "me", "id": msg_id, "format": format}
+                if metadata_headers:
+                    kwargs["metadataHeaders"] = metadata_headers
+                batch.add(service.users().messages().get(**kwargs), request_id=msg_id)
+            batch.execute()
+
+        pending = [msg_id for msg_id, error in errors.items() if is_retryable(error)]
+        if not pending or attempt == retries:
+            break
+        time.sleep(backoff_delay(attempt))
+
+    return [fetched[msg_id] for msg_id in msg_ids if msg_id in fetched], errors
+
+
+def _discovery_document() -> dict:
+    """The Gmail v1 discovery document, parsed once per process."""
+    global _discovery_doc
+    with _discovery_lock:
+        if _discovery_doc is None:
+            from googleapiclient.discovery import build
+            from googleapiclient.discovery_cache import get_static_doc
+
+            doc = get_static_doc("gmail", "v1")
+            if doc is None:
+                # Not bundled with this client library: fetch it once
+                doc = build("gmail", "v1", static_discovery=False)._rootDesc
+            _discovery_doc = json.loads(doc) if isinstance(doc, str) else doc
+        return _discovery_doc
+
+
+class GmailClient:
+    """Authenticated Gmail API access for one token file."""
+
+    def __init__(
+        self,
+        token_path: Path,
+        credentials_path: Path | None = None,
+        scopes: list[str] | None = None,
+        interactive: bool = False,
+        log: Callable[[str], None] = print,
+    ):
+        self.token_path = Path(token_path)
+        self.credentials_path = Path(credentials_path) if credentials_path else None
+        self.scopes = scopes
+        self.interactive = interactive
+        self.log = log
+        self._creds = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def credentials(self):
+        """
+        Return valid credentials, refreshing or re-authorising if needed.
+
+        Refreshed tokens are written back to token_path. The browser OAuth
+        flow only runs for interactive clients; otherwise GmailAuthError is
+        raised when the token is missing or cannot be refreshed.
+        """
+        with self._lock:
+            if self._creds is not None and self._creds.valid:
+                return self._creds
+
+            from google.auth.transport.requests import Request
+            from google.oauth2.credentials import Credentials
+
+            creds = self._creds
+            if creds is None and self.token_path.exists():
+                try:
+                    creds = Credentials.from_authorized_user_file(str(self.token_path), self.scopes)
+                except Exception as e:
+                    self.log(f"[Gmail] Could not load token: {e}")
+
+            if creds is not None and not creds.valid:
+                if creds.expired and creds.refresh_token:
+                    self.log("[Gmail] Refreshing expired token...")
+                    try:
+                        creds.refresh(Request())
+                    except Exception as e:
+                        self.log(f"[Gmail] Token refresh failed: {e}")
+                        creds = None
+                else:
+                    creds = None
+                if creds is not None:
+                    self._save_token(creds)
+
+            if creds is None:
+                creds = self._authorize()
+                self._save_token(creds)
+
+            self._creds = creds
+            return creds
+
+    def _authorize(self):
+        """Run the browser OAuth flow for interactive clients."""
+        if not self.interactive:
+            raise GmailAuthError(
+                f"No valid Gmail token at {self.token_path}. "
+                "Run the gmail_watcher.py first to complete OAuth."
+            )
+        if self.credentials_path is None or not self.credentials_path.exists():
+            raise FileNotFoundError(
+                f"Credentials file not found: {self.credentials_path}\n"
+                "Run /gmail-setup skill for setup instructions."
+            )
+
+        from google_auth_oauthlib.flow import InstalledAppFlow
+
+        self.log("[Gmail] Starting OAuth flow...")
+        flow = InstalledAppFlow.from_client_secrets_file(str(self.credentials_path), self.scopes)
+        return flow.run_local_server(port=0)
+
+    def _save_token(self, creds):
+        self.token_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.token_path, "w") as token:
+            token.write(creds.to_json())
+        self.log(f"[Gmail] Token saved to {self.token_path}")
+
+    def service(self):
+        """Gmail service for the calling thread, reused across calls."""
+        from googleapiclient.discovery import build_from_document
+
+        creds = self.credentials()
+        service = getattr(self._local, "service", None)
+        if service is None or getattr(self._local, "creds", None) is not creds:
+            service = build_from_document(_discovery_document(), credentials=creds)
+            self._local.service = service
+            self._local.creds = creds
+        return service
+
+    def _session(self):
+        """Authorized requests session for the calling thread, for streamed downloads."""
+        from google.auth.transport.requests import AuthorizedSession
+
+        creds = self.credentials()
+        session = getattr(self._local, "session", None)
+        if session is None or session.credentials is not creds:
+            session = AuthorizedSession(creds)
+            self._local.session = session
+        return session
+
+    def download_attachment(
+        self,
+        msg_id: str,
+        attachment_id: str,
+        out,
+        max_bytes: int | None = None,
+    ) -> tuple[str, int]:
+        """
+        Stream an attachment's decoded bytes into a binary file object.
+
+        The API wraps the data in JSON as one base64 string; it is decoded
+        as it arrives instead of being loaded whole. Returns (sha256 hex
+        digest, size); raises AttachmentTooLarge past max_bytes.
+        """
+        from common.gmail_mime import iter_json_string, stream_base64
+
+        url = f"{API_ROOT}/users/me/messages/{msg_id}/attachments/{attachment_id}"
+        with self._session().get(url, stream=True, timeout=60) as response:
+            response.raise_for_status()
+            chunks = response.iter_content(DOWNLOAD_CHUNK)
+            return stream_base64(iter_json_string(chunks, b"data"), out, max_bytes)
+
+    def list_message_ids(
+        self,
+        query: str,
+        max_results: int = 100,
+        page_token: str | None = None,
+        retries: int = 0,
+    ) -> tuple[list[str], str | None]:
+        """Return (message IDs, next page token) for a search query."""
+        response = execute_with_backoff(
+            self.service().users().messages().list(
+                userId="me", q=query, maxResults=max_results, pageToken=page_token
+            ),
+            retries,
+        )
+        ids = [msg_ref["id"] for msg_ref in response.get("messages", [])]
+        return ids, response.get("nextPageToken")
+
+    def get_messages(
+        self,
+        msg_ids: list[str],
+        format: str = "full",
+        metadata_headers: list[str] | None = None,
+        retries: int = 0,
+    ) -> tuple[list[dict], dict[str, Exception]]:
+        """Fetch messages by ID in batches; see batch_get_messages()."""
+        return batch_get_messages(self.service(), msg_ids, format, metadata_headers, retries)
+
+    async def alist_message_ids(self, *args, **kwargs) -> tuple[list[str], str | None]:
+        """Async list_message_ids()."""
+        return await asyncio.to_thread(self.list_message_ids, *args, **kwargs)
+
+    async def aget_messages(self, *args, **kwargs) -> tuple[list[dict], dict[str, Exception]]:
+        """Async get_messages()."""
+        return await asyncio.to_thread(self.get_messages, *args, **kwargs)
+
+
+def get_client(
+    token_path: Path,
+    credentials_path: Path | None = None,
+    scopes: list[str] | None = None,
+    interactive: bool = False,
+    log: Callable[[str], None] = print,
+) -> GmailClient:
+    """Return the process-wide GmailClient for a token file."""
+    token_path = Path(token_path).resolve()
+    with _clients_lock:
+        client = _clients.get(token_path)
+        if client is None:
+            client = GmailClient(token_path, credentials_path, scopes, interactive, log)
+            _clients[token_path] = client
+        return client
@@ -0,0 +1,234 @@
+"""
+Body extraction for Gmail API message payloads.
+
+A Gmail payload is a tree of MIME parts; the readable text may sit several
+levels down (multipart/mixed > multipart/alternative > text/plain) or exist
+only as text/html. extract_body() walks the tree for the best text part and
+base64-decodes it in chunks, stopping once it has enough characters, so a
+large body is never decoded in full just to keep its first few KB.
+
+list_attachments() describes a message's attachments, and stream_base64()
+decodes attachment data chunk by chunk into a file while hashing it, so
+attachments never sit in memory as one base64 string.
+"""
+
+import base64
+import binascii
+import codecs
+import hashlib
+import html
+import re
+
+DECODE_CHUNK = 4096  # base64 characters per decode step; a multiple of 4
+HTML_OVERSCAN = 4  # markup characters decoded per character of text wanted
+
+_CHARSET_RE = re.compile(r"charset\s*=\s*\"?([\w.:-]+)", re.IGNORECASE)
+_HTML_DROP_RE = re.compile(r"<(script|style|head)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+# A block cut off by the decode budget: everything after its opening tag is markup
+_HTML_OPEN_DROP_RE = re.compile(r"<(?:script|style|head)\b.*\Z", re.IGNORECASE | re.DOTALL)
+_HTML_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+_HTML_BREAK_RE = re.compile(r"<(?:br|/p|/div|/tr|/li|/h[1-6]|/table)\b[^>]*>", re.IGNORECASE)
+_HTML_TAG_RE = re.compile(r"<[^>]*>|<[^>]*$")
+_SPACES_RE = re.compile(r"[ \t\r\f\v\xa0]+")
+_BLANK_LINES_RE = re.compile(r"\n\s*\n\s*")
+
+
+class AttachmentTooLarge(ValueError):
+    """Raised when attachment data exceeds the allowed size."""
+
+
+def part_headers(part: dict) -> dict:
+    """A part's headers as a lowercase-name dict."""
+    return {h["name"].lower(): h["value"] for h in part.get("headers", [])}
+
+
+def is_attachment(part: dict) -> bool:
+    """Whether a part is an attachment rather than message text."""
+    if part.get("filename"):
+        return True
+    disposition = part_headers(part).get("content-disposition", "")
+    return disposition.lower().startswith("attachment")
+
+
+def iter_parts(payload: dict):
+    """Yield the leaf parts of a payload in document order, depth first."""
+    stack = [payload]
+    while stack:
+        part = stack.pop()
+        children = part.get("parts")
+        if children:
+            stack.extend(reversed(children))
+        else:
+            yield part
+
+
+def find_text_part(payload: dict) -> dict | None:
+    """The first inline text/plain part, else the first inline text/html part."""
+    html_part = None
+    for part in iter_parts(payload):
+        if is_attachment(part) or not part.get("body", {}).get("data"):
+            continue
+        mime_type = part.get("mimeType", "").lower()
+        if mime_type == "text/plain":
+            return part
+        if mime_type == "text/html" and html_part is None:
+            html_part = part
+    return html_part
+
+
+def decode_text(data: str, charset: str = "utf-8", limit: int | None = None) -> tuple[str, bool]:
+    """
+    Decode base64url part data to text, stopping after `limit` characters.
+
+    Returns (text, truncated). Undecodable bytes are replaced, and malformed
+    base64 ends the text where it starts.
+    """
+    try:
+        decoder = codecs.getincrementaldecoder(charset)(errors="replace")
+    except LookupError:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    chunks = []
+    size = 0
+    for start in range(0, len(data), DECODE_CHUNK):
+        chunk = data[start:start + DECODE_CHUNK]
+        try:
+            raw = base64.urlsafe_b64decode(chunk + "=" * (-len(chunk) % 4))
+        except (binascii.Error, ValueError):
+            break
+        text = decoder.decode(raw)
+        chunks.append(text)
+        size += len(text)
+        if limit is not None and size > limit:
+            return "".join(chunks)[:limit], True
+
+    chunks.append(decoder.decode(b"", final=True))
+    text = "".join(chunks)
+    if limit is not None and len(text) > limit:
+        return text[:limit], True
+    return text, False
+
+
+def html_to_text(markup: str) -> str:
+    """Cheap HTML to text: drop scripts/styles and tags, keep line breaks."""
+    text = _HTML_DROP_RE.sub(" ", markup)
+    text = _HTML_OPEN_DROP_RE.sub(" ", text)
+    text = _HTML_COMMENT_RE.sub(" ", text)
+    text = _HTML_BREAK_RE.sub("\n", text)
+    text = html.unescape(_HTML_TAG_RE.sub(" ", text))
+    text = "\n".join(_SPACES_RE.sub(" ", line).strip() for line in text.split("\n"))
+    return _BLANK_LINES_RE.sub("\n\n", text).strip()
+
+
+def extract_body(payload: dict, limit: int) -> tuple[str, bool] | None:
+    """
+    Extract up to `limit` characters of readable text from a payload.
+
+    Returns (text, truncated), or None if the message has no inline text
+    (or an HTML part yields none within its decode budget).
+    """
+    part = find_text_part(payload)
+    if part is None:
+        return None
+
+    content_type = part_headers(part).get("content-type", "")
+    match = _CHARSET_RE.search(content_type)
+    charset = match.group(1) if match else "utf-8"
+    data = part["body"]["data"]
+
+    if part.get("mimeType", "").lower() != "text/html":
+        return decode_text(data, charset, limit)
+
+    markup, cut = decode_text(data, charset, limit * HTML_OVERSCAN)
+    text = html_to_text(markup)
+    if not text:
+        return None
+    if len(text) > limit:
+        return text[:limit], True
+    return text, cut
+
+
+def list_attachments(payload: dict) -> list[dict]:
+    """
+    Describe a payload's attachments.
+
+    Each entry has filename, mime_type, size and either attachment_id (data
+    fetched separately) or data (small attachments inlined by Gmail).
+    """
+    attachments = []
+    for part in iter_parts(payload):
+        body = part.get("body", {})
+        if not is_attachment(part) or not (body.get("attachmentId") or body.get("data")):
+            continue
+        attachments.append(
+            {
+                "filename": part.get("filename") or "attachment",
+                "mime_type": part.get("mimeType", "application/octet-stream"),
+                "size": int(body.get("size", 0)),
+                "attachment_id": body.get("attachmentId"),
+                "data": body.get("data"),
+            }
+        )
+    return attachments
+
+
+def iter_json_string(chunks, key: bytes):
+    """
+    Yield the raw bytes of a top-level JSON string field from streamed chunks.
+
+    Meant for Gmail responses like {"size": 123, "data": "<base64url>"},
+    whose base64 alphabet never needs escaping.
+    """
+    marker = re.compile(rb'"' + re.escape(key) + rb'"\s*:\s*"')
+    buf = b""
+    found = False
+    for chunk in chunks:
+        buf += chunk
+        if not found:
+            match = marker.search(buf)
+            if match is None:
+                buf = buf[-(len(key) + 16):]  # the key may straddle chunks
+                continue
+            buf = buf[match.end():]
+            found = True
+
+        end = buf.find(b'"')
+        if end >= 0:
+            yield buf[:end]
+            return
+        yield buf
+        buf = b""
+
+    raise ValueError(f"response has no complete {key.decode()!r} field")
+
+
+def stream_base64(chunks, out, max_bytes: int | None = None) -> tuple[str, int]:
+    """
+    Decode base64url byte chunks into a binary file object.
+
+    Returns (sha256 hex digest, decoded size). Raises AttachmentTooLarge as
+    soon as the output would exceed max_bytes.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    pending = b""
+
+    def write(encoded: bytes):
+        nonlocal size
+        raw = base64.urlsafe_b64decode(encoded)
+        size += len(raw)
+        if max_bytes is not None and size > max_bytes:
+            raise AttachmentTooLarge(f"more than {max_bytes} bytes")
+        digest.update(raw)
+        out.write(raw)
+
+    for chunk in chunks:
+        pending += chunk.strip().rstrip(b"=")
+        usable = len(pending) - len(pending) % 4
+        if usable:
+            write(pending[:usable])
+            pending = pending[usable:]
+
+    if pending:
+        write(pending + b"=" * (-len(pending) % 4))
+    return digest.hexdigest(), size
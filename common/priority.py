@@ -0,0 +1,176 @@
+"""
+Keyword priority classification shared by the watchers and orchestrator.
+
+Rules map keywords to a priority level and a weight. They are read from the
+"## Priority Keywords" table in Company_Handbook.md, one row per level:
+
+    | 🔴 Critical | urgent, emergency, asap |
+    | 🟡 Medium   | question, meeting (0.5) |
+
+A keyword's weight defaults to 1 and can be set in parentheses. All
+keywords are compiled into one regex over the lowercased text, so a text is
+scanned once however many rules there are, and keywords only match whole
+words ("update" does not match "updated"). Each distinct keyword counts
+once; subject matches count SUBJECT_BOOST times. The result is the most
+urgent level whose total weight reaches MIN_SCORE.
+
+get_classifier() caches the compiled classifier per handbook and rebuilds
+it when the file changes, so rules can be tuned without a restart.
+"""
+
+import re
+import threading
+from pathlib import Path
+
+PRIORITY_ORDER = ("critical", "high", "medium", "low")
+PRIORITY_EMOJI = {
+    "critical": "🔴",
+    "high": "🟠",
+    "medium": "🟡",
+    "low": "🟢",
+}
+
+# Used when the handbook has no Priority Keywords table
+DEFAULT_RULES = {
+    "critical": {"urgent": 1.0, "emergency": 1.0, "asap": 1.0, "immediately": 1.0},
+    "high": {"important": 1.0, "deadline": 1.0, "payment": 1.0, "invoice": 1.0},
+    "medium": {"question": 1.0, "update": 1.0, "follow-up": 1.0, "meeting": 1.0},
+    "low": {"fyi": 1.0, "no rush": 1.0},
+}
+
+HANDBOOK_SECTION = "## Priority Keywords"
+MIN_SCORE = 1.0  # total weight a level needs to be chosen
+SUBJECT_BOOST = 2.0  # weight multiplier for keywords found in the subject
+
+_KEYWORD_RE = re.compile(r"^(.+?)\s*(?:\(\s*(-?[\d.]+)\s*\))?$")
+
+_cache: dict[Path | None, tuple[tuple[int, int], "PriorityClassifier"]] = {}
+_cache_lock = threading.Lock()
+
+
+class PriorityClassifier:
+    """Compiled keyword rules for assigning a priority level to text."""
+
+    def __init__(self, rules: dict[str, dict[str, float]]):
+        self.rules = {level: dict(rules.get(level, {})) for level in PRIORITY_ORDER}
+        self._keywords: dict[str, tuple[str, float]] = {}
+        for level in PRIORITY_ORDER:
+            for keyword, weight in self.rules[level].items():
+                # The most urgent level wins if a keyword is listed twice
+                self._keywords.setdefault(" ".join(keyword.lower().split()), (level, weight))
+
+        # Longest first so "no rush" is preferred over a shorter overlapping keyword.
+        # Text is lowercased before matching; the first-letter lookahead lets
+        # the regex engine skip most positions without trying every keyword.
+        alternatives = sorted(self._keywords, key=len, reverse=True)
+        if alternatives:
+            pattern = "|".join(r"\s+".join(map(re.escape, k.split())) for k in alternatives)
+            firsts = re.escape("".join(sorted({k[0] for k in alternatives})))
+            self._pattern = re.compile(rf"(?<!\w)(?=[{firsts}])(?:{pattern})(?!\w)")
+        else:
+            self._pattern = None
+
+    def scores(self, text: str, subject: str = "") -> dict[str, float]:
+        """Total keyword weight per level for a text and optional subject."""
+        totals = dict.fromkeys(PRIORITY_ORDER, 0.0)
+        if self._pattern is None:
+            return totals
+
+        seen = {}
+        for source, boost in ((subject, SUBJECT_BOOST), (text, 1.0)):
+            for match in self._pattern.finditer((source or "").lower()):
+                keyword = " ".join(match.group().split())
+                seen[keyword] = max(seen.get(keyword, 0.0), boost)
+
+        for keyword, boost in seen.items():
+            level, weight = self._keywords[keyword]
+            totals[level] += weight * boost
+        return totals
+
+    def classify(self, text: str, subject: str = "", default: str | None = "low") -> str | None:
+        """Most urgent level whose keywords reach MIN_SCORE, else default."""
+        totals = self.scores(text, subject)
+        for level in PRIORITY_ORDER:
+            if totals[level] >= MIN_SCORE:
+                return level
+        return default
+
+
+def parse_handbook_rules(content: str) -> dict[str, dict[str, float]]:
+    """
+    Read keyword rules from the handbook's Priority Keywords table.
+
+    Returns {} if the section or table is missing.
+    """
+    rules: dict[str, dict[str, float]] = {}
+    in_section = False
+
+    for line in content.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("## "):
+            in_section = stripped.lower() == HANDBOOK_SECTION.lower()
+            continue
+        if not in_section or not stripped.startswith("|"):
+            continue
+
+        cells = [cell.strip() for cell in stripped.strip("|").split("|")]
+        if len(cells) < 2:
+            continue
+        label = cells[0].lower()
+        level = next((name for name in PRIORITY_ORDER if name in label.split()), None)
+        if level is None:
+            continue  # header or separator row
+
+        for item in cells[1].split(","):
+            match = _KEYWORD_RE.match(item.strip())
+            if not match:
+                continue
+            keyword, weight = match.groups()
+            try:
+                rules.setdefault(level, {})[keyword.lower()] = float(weight) if weight else 1.0
+            except ValueError:
+                rules.setdefault(level, {})[keyword.lower()] = 1.0
+
+    return rules
+
+
+def get_classifier(handbook_path: Path | None = None) -> PriorityClassifier:
+    """
+    Classifier built from a handbook, reloaded when the file changes.
+
+    Falls back to DEFAULT_RULES if the handbook is missing or has no
+    Priority Keywords table.
+    """
+    if handbook_path is None:
+        return _default_classifier()
+
+    handbook_path = Path(handbook_path)
+    try:
+        st = handbook_path.stat()
+    except OSError:
+        return _default_classifier()
+
+    key = (st.st_mtime_ns, st.st_size)
+    with _cache_lock:
+        cached = _cache.get(handbook_path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+    try:
+        rules = parse_handbook_rules(handbook_path.read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError):
+        rules = {}
+    classifier = PriorityClassifier(rules) if rules else _default_classifier()
+
+    with _cache_lock:
+        _cache[handbook_path] = (key, classifier)
+    return classifier
+
+
+def _default_classifier() -> PriorityClassifier:
+    with _cache_lock:
+        cached = _cache.get(None)
+        if cached is None:
+            cached = ((0, 0), PriorityClassifier(DEFAULT_RULES))
+            _cache[None] = cached
+        return cached[1]
@@ -0,0 +1,144 @@
+"""
+Bounded store of processed item IDs.
+
+IDs live in a small sqlite table keyed by ID, so startup does not load the
+history into memory and recording an ID does not rewrite the whole set.
+New IDs are buffered and written in one transaction by flush(), which
+callers invoke once per poll cycle. Entries older than the retention
+window, or beyond the entry cap, are pruned at most once an hour.
+
+An ID can carry a short string value (e.g. where the item was saved), so
+the store also serves as a persistent key -> value index.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+RETENTION_DAYS = 365  # forget IDs processed longer ago than this
+MAX_ENTRIES = 200_000  # hard cap on stored IDs, oldest dropped first
+PRUNE_INTERVAL = 3600  # seconds between prune passes
+
+
+class ProcessedIdStore:
+    """Set-like, persistent record of processed IDs."""
+
+    def __init__(
+        self,
+        db_path: Path,
+        retention_days: int = RETENTION_DAYS,
+        max_entries: int = MAX_ENTRIES,
+    ):
+        self.db_path = Path(db_path)
+        self.retention = retention_days * 86400
+        self.max_entries = max_entries
+        self._pending: dict[str, tuple[float, str | None]] = {}
+        self._last_prune = 0.0
+        self._lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS processed ("
+            " id TEXT PRIMARY KEY,"
+            " processed_at REAL NOT NULL,"
+            " value TEXT"
+            ") WITHOUT ROWID"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS processed_at_idx ON processed (processed_at)"
+        )
+        self._conn.commit()
+
+    def __contains__(self, item_id: str) -> bool:
+        with self._lock:
+            if item_id in self._pending:
+                return True
+            row = self._conn.execute(
+                "SELECT 1 FROM processed WHERE id = ?", (item_id,)
+            ).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM processed").fetchone()
+            return count + len(self._pending)
+
+    def get(self, item_id: str) -> str | None:
+        """The value recorded with an ID, or None."""
+        with self._lock:
+            if item_id in self._pending:
+                return self._pending[item_id][1]
+            row = self._conn.execute(
+                "SELECT value FROM processed WHERE id = ?", (item_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def add(self, item_id: str, value: str | None = None):
+        """Record an ID (with an optional value); it is persisted by the next flush()."""
+        with self._lock:
+            pending = self._pending.get(item_id)
+            self._pending[item_id] = (pending[0] if pending else time.time(), value)
+
+    def flush(self):
+        """Write buffered IDs in one transaction and prune if due."""
+        with self._lock:
+            if self._pending:
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT INTO processed (id, processed_at, value) VALUES (?, ?, ?)"
+                        " ON CONFLICT (id) DO UPDATE SET value = excluded.value",
+                        ((item_id, at, value) for item_id, (at, value) in self._pending.items()),
+                    )
+                self._pending.clear()
+
+            if time.time() - self._last_prune >= PRUNE_INTERVAL:
+                self._prune()
+
+    def _prune(self):
+        now = time.time()
+        with self._conn:
+            self._conn.execute(
+                "DELETE FROM processed WHERE processed_at < ?", (now - self.retention,)
+            )
+            self._conn.execute(
+                "DELETE FROM processed WHERE processed_at <= ("
+                " SELECT processed_at FROM processed"
+                " ORDER BY processed_at DESC LIMIT 1 OFFSET ?)",
+                (self.max_entries,),
+            )
+        self._last_prune = now
+
+    def import_json(self, json_path: Path, key: str = "processed_ids") -> int:
+        """
+        Import IDs from a legacy JSON file (`{key: [...]}`) and retire it.
+
+        The file is renamed with a `.migrated` suffix. Returns the number of
+        IDs imported.
+        """
+        json_path = Path(json_path)
+        if not json_path.exists():
+            return 0
+        try:
+            with open(json_path, "r") as f:
+                ids = json.load(f).get(key, [])
+        except (json.JSONDecodeError, IOError):
+            return 0
+
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO processed (id, processed_at) VALUES (?, ?)",
+                ((item_id, now) for item_id in ids),
+            )
+        json_path.rename(json_path.with_name(json_path.name + ".migrated"))
+        return len(ids)
+
+    def close(self):
+        """Flush pending IDs and close the database."""
+        self.flush()
+        with self._lock:
+            self._conn.close()
@@ -17,6 +17,7 @@ import json
 import os
 import smtplib
 import ssl
+import sys
 from datetime import datetime
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
@@ -29,6 +30,9 @@ from fastmcp import FastMCP
 # Load environment variables
 load_dotenv()
 
+# Allow importing the shared vault helpers when run as a script
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
 # Initialize FastMCP server
 mcp = FastMCP("email-mcp")
 
@@ -266,7 +270,7 @@ status: draft
 
 
 @mcp.tool()
-def search_emails(
+async def search_emails(
     query: str,
     max_results: int = 10,
 ) -> str:
@@ -283,51 +287,34 @@ def search_emails(
         JSON string with matching email summaries
     """
     try:
-        from google.auth.transport.requests import Request
-        from google.oauth2.credentials import Credentials
-        from googleapiclient.discovery import build
+        from common.gmail_client import GmailAuthError, get_client
 
         token_path = VAULT_PATH / "config" / "token.json"
-        credentials_path = VAULT_PATH / "config" / "credentials.json"
 
         if not token_path.exists():
             log_action("search_failed", {"error": "No token.json - run OAuth flow first"})
             return "ERROR: Gmail not authenticated. Run the gmail_watcher.py first to complete OAuth."
 
-        creds = Credentials.from_authorized_user_file(str(token_path))
-
-        if not creds.valid:
-            if creds.expired and creds.refresh_token:
-                creds.refresh(Request())
-                with open(token_path, "w") as f:
-                    f.write(creds.to_json())
-            else:
-                return "ERROR: Gmail token expired. Re-run OAuth flow."
-
-        service = build("gmail", "v1", credentials=creds)
+        # Shared for the life of the server: token refresh and the API client happen once
+        client = get_client(token_path, log=lambda msg: print(msg, file=sys.stderr))
 
-        results = (
-            service.users()
-            .messages()
-            .list(userId="me", q=query, maxResults=max_results)
-            .execute()
-        )
-
-        messages = results.get("messages", [])
+        try:
+            msg_ids, _ = await client.alist_message_ids(query, max_results=max_results)
+        except GmailAuthError:
+            return "ERROR: Gmail token expired. Re-run OAuth flow."
 
-        if not messages:
+        if not msg_ids:
             log_action("search_complete", {"query": query, "count": 0})
             return json.dumps({"query": query, "count": 0, "messages": []})
 
-        email_summaries = []
-        for msg_ref in messages:
-            msg = (
-                service.users()
-                .messages()
-                .get(userId="me", id=msg_ref["id"], format="metadata")
-                .execute()
-            )
+        fetched, errors = await client.aget_messages(
+            msg_ids,
+            format="metadata",
+            metadata_headers=["From", "Subject", "Date"],
+        )
 
+        email_summaries = []
+        for msg in fetched:
             headers = {h["name"].lower(): h["value"] for h in msg.get("payload", {}).get("headers", [])}
 
             email_summaries.append(
@@ -340,6 +327,9 @@ def search_emails(
                 }
             )
 
+        if errors:
+            log_action("search_partial", {"query": query, "failed_ids": list(errors)})
+
         log_action("search_complete", {"query": query, "count": len(email_summaries)})
 
         return json.dumps(
@@ -3,29 +3,65 @@
 AI Employee Orchestrator (Silver Tier)
 
 A simple orchestrator that monitors vault folders and coordinates actions.
-Polls /Needs_Action and /Approved folders every 30 seconds.
+Polls /Needs_Action and /Approved folders every 30 seconds, or reacts to
+new files immediately in event-driven mode.
 
 Usage:
     python orchestrator.py
     python orchestrator.py --dry-run
     python orchestrator.py --vault-path /custom/path
     python orchestrator.py --interval 60
+    python orchestrator.py --event-driven --reconcile-interval 300
+    python orchestrator.py --workers 4
+    python orchestrator.py --workers 2 --batch-size 5
 """
 
 import argparse
+import asyncio
+import contextlib
+import hashlib
+import heapq
+import itertools
 import json
 import logging
+import os
 import re
-import subprocess
+import signal
 import sys
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.observers import Observer
+
+from common.frontmatter import read_frontmatter
+from common.priority import PriorityClassifier, get_classifier
+
 # Configuration
 DEFAULT_INTERVAL = 30  # seconds
+DEFAULT_RECONCILE_INTERVAL = 300  # seconds, event-driven mode only
+EVENT_SETTLE_SECONDS = 0.5  # quiet time after a new file's last write before queueing it
+DEFAULT_WORKERS = 1
+DEFAULT_BATCH_SIZE = 1  # Needs_Action files per Claude call; 1 disables batching
+PRIORITY_AGING = 300  # seconds of waiting that lift an item one priority level
+FOLDER_RESCAN_INTERVAL = 300  # seconds before an unchanged folder is rechecked
+DIR_MTIME_SLACK = 2  # seconds; a directory changed this recently is always listed
+CLAUDE_COMMAND = ["claude", "--print"]
+CLAUDE_SOFT_TIMEOUT = 120  # seconds before a run is reported as slow
+CLAUDE_HARD_TIMEOUT = 300  # seconds before a run is killed
+CLAUDE_LINE_LIMIT = 1024 * 1024  # max bytes per streamed output line
 STATE_FILE = "memory/orchestrator_state.json"
+JOURNAL_COMPACT_THRESHOLD = 1000  # journal entries before a snapshot rewrite
+DIGEST_HISTORY = 10000  # content hashes remembered per folder
+# Folders whose files are never re-run after an in-place edit: an approved
+# action logs its result into its own file, and re-running it would repeat
+# the action (e.g. send the email again)
+RUN_ONCE_FOLDERS = ("approved",)
+# Frontmatter keys Claude rewrites while working; ignored when hashing content
+VOLATILE_FRONTMATTER_KEYS = ("status",)
 LOG_FILE = "orchestrator.log"
 
 
@@ -59,77 +95,473 @@ def setup_logging(vault_path: Path) -> logging.Logger:
 
 
 class OrchestratorState:
-    """Manages persistent state across restarts."""
+    """
+    Manages persistent state across restarts.
+
+    Processed filenames are kept in in-memory indexes together with a hash of
+    the content they had when processed, so a file edited in place is picked
+    up again (except in RUN_ONCE_FOLDERS) and a renamed copy of processed
+    content is not. Every change is appended to a journal next to the state
+    file, and the journal is folded into a fresh snapshot (written via an
+    atomic rename) once it grows past JOURNAL_COMPACT_THRESHOLD entries or
+    on shutdown.
+    """
 
-    def __init__(self, state_file: Path):
+    def __init__(self, state_file: Path, vault_path: Optional[Path] = None):
         self.state_file = state_file
+        self.journal_file = state_file.with_suffix(".journal")
+        # Used at compaction time to forget files that have left their folder
+        self.vault_path = vault_path
+        # Worker threads share one state object
+        self._lock = threading.RLock()
+        # folder -> {filename: content digest (None for pre-hash entries)}
+        self.processed: dict[str, dict[str, Optional[str]]] = {}
+        # folder -> recently processed digests, oldest first
+        self.digests: dict[str, dict[str, None]] = {}
+        # path -> (mtime_ns, size, digest) so unchanged files are not rehashed
+        self._digest_cache: dict[Path, tuple[int, int, str]] = {}
         self.state = self._load()
+        self._journal = None
+        self._journal_entries = 0
+        self._replay_journal()
 
     def _load(self) -> dict:
-        """Load state from disk."""
-        if self.state_file.exists():
-            try:
-                with open(self.state_file, "r") as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                pass
-        return {
-            "processed_needs_action": [],
-            "processed_approved": [],
+        """Load the last snapshot from disk."""
+        state = {
             "last_run": None,
+            "journal_seq": 0,
             "stats": {
                 "needs_action_processed": 0,
                 "approved_executed": 0,
                 "errors": 0,
             }
         }
+        if self.state_file.exists():
+            try:
+                with open(self.state_file, "r") as f:
+                    state.update(json.load(f))
+            except (json.JSONDecodeError, IOError):
+                pass
+
+        for key in list(state):
+            if key.startswith("processed_"):
+                folder = key.removeprefix("processed_")
+                names = state.pop(key)
+                if isinstance(names, list):
+                    # Snapshots from before content hashing
+                    names = dict.fromkeys(names)
+                self.processed[folder] = names
+            elif key.startswith("digests_"):
+                folder = key.removeprefix("digests_")
+                self.digests[folder] = dict.fromkeys(state.pop(key))
+        for folder in WATCHED_FOLDERS:
+            self.processed.setdefault(folder, {})
+            self.digests.setdefault(folder, {})
+
+        self._seq = state["journal_seq"]
+        return state
+
+    def _replay_journal(self) -> None:
+        """Apply journal entries written after the last snapshot."""
+        if not self.journal_file.exists():
+            return
+        good_end = 0
+        with open(self.journal_file, "rb") as f:
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("unterminated entry")
+                    entry = json.loads(line)
+                except ValueError:
+                    # Torn write from a crash; everything after it is suspect
+                    break
+                good_end += len(line)
+                self._journal_entries += 1
+                if entry["seq"] <= self.state["journal_seq"]:
+                    continue
+                self._apply(entry)
+                self._seq = entry["seq"]
+            torn = f.seek(0, os.SEEK_END) > good_end
+
+        if torn:
+            # Cut the fragment off so new entries do not get appended to it
+            with open(self.journal_file, "r+b") as f:
+                f.truncate(good_end)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _apply(self, entry: dict) -> None:
+        if entry["op"] == "processed":
+            folder, digest = entry["folder"], entry.get("digest")
+            self.processed.setdefault(folder, {})[entry["name"]] = digest
+            if digest:
+                folder_digests = self.digests.setdefault(folder, {})
+                folder_digests.pop(digest, None)
+                folder_digests[digest] = None
+        elif entry["op"] == "stat" and entry["stat"] in self.state["stats"]:
+            self.state["stats"][entry["stat"]] += 1
+
+    def _append(self, entry: dict) -> None:
+        """Apply an entry in memory and append it to the journal. Caller holds the lock."""
+        self._seq += 1
+        entry["seq"] = self._seq
+        self._apply(entry)
+        if self._journal is None:
+            self.journal_file.parent.mkdir(parents=True, exist_ok=True)
+            self._journal = open(self.journal_file, "a", encoding="utf-8")
+        self._journal.write(json.dumps(entry) + "\n")
+        self._journal_entries += 1
 
     def save(self) -> None:
-        """Save state to disk."""
-        self.state_file.parent.mkdir(parents=True, exist_ok=True)
-        self.state["last_run"] = datetime.now().isoformat()
-        with open(self.state_file, "w") as f:
-            json.dump(self.state, f, indent=2)
-
-    def is_processed(self, folder: str, filename: str) -> bool:
-        """Check if a file has been processed."""
-        key = f"processed_{folder}"
-        return filename in self.state.get(key, [])
-
-    def mark_processed(self, folder: str, filename: str) -> None:
+        """Make journalled changes durable, compacting when the journal is long."""
+        with self._lock:
+            if self._journal is not None:
+                self._journal.flush()
+                os.fsync(self._journal.fileno())
+            if self._journal_entries >= JOURNAL_COMPACT_THRESHOLD:
+                self.compact()
+
+    def compact(self) -> None:
+        """Write a fresh snapshot atomically and truncate the journal."""
+        with self._lock:
+            self._prune_missing()
+            self.state["last_run"] = datetime.now().isoformat()
+            self.state["journal_seq"] = self._seq
+            snapshot = dict(self.state)
+            for folder, names in self.processed.items():
+                snapshot[f"processed_{folder}"] = names
+            for folder, digests in self.digests.items():
+                snapshot[f"digests_{folder}"] = list(digests)
+
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.state_file.with_suffix(".tmp")
+            with open(tmp_file, "w") as f:
+                json.dump(snapshot, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.state_file)
+            if os.name == "posix":
+                dir_fd = os.open(self.state_file.parent, os.O_RDONLY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
+
+            # Entries up to journal_seq are now in the snapshot
+            if self._journal is not None:
+                self._journal.close()
+            self._journal = open(self.journal_file, "w", encoding="utf-8")
+            self._journal_entries = 0
+
+    def _prune_missing(self) -> None:
+        """Forget processed names whose files are no longer in their folder."""
+        for folder, digests in self.digests.items():
+            for digest in list(digests)[:max(0, len(digests) - DIGEST_HISTORY)]:
+                del digests[digest]
+
+        if self.vault_path is None:
+            return
+        for folder, (subfolder, _, _) in WATCHED_FOLDERS.items():
+            try:
+                present = set(os.listdir(self.vault_path / subfolder))
+            except OSError:
+                continue
+            names = self.processed[folder]
+            for name in names.keys() - present:
+                del names[name]
+        self._digest_cache = {
+            path: cached for path, cached in self._digest_cache.items()
+            if path.exists()
+        }
+
+    def digest(self, file_path: Path) -> Optional[str]:
+        """
+        Return the content digest of a file, or None if it cannot be read.
+
+        The hash is only recomputed when the file's mtime or size changes.
+        """
+        try:
+            st = file_path.stat()
+        except OSError:
+            return None
+        with self._lock:
+            cached = self._digest_cache.get(file_path)
+        if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2]
+        try:
+            digest = content_digest(file_path.read_bytes())
+        except OSError:
+            return None
+        with self._lock:
+            self._digest_cache[file_path] = (st.st_mtime_ns, st.st_size, digest)
+        return digest
+
+    def close(self) -> None:
+        """Compact and release the journal."""
+        with self._lock:
+            self.compact()
+            self._journal.close()
+            self._journal = None
+
+    def is_processed(
+        self,
+        folder: str,
+        filename: str,
+        digest: Optional[str] = None
+    ) -> bool:
+        """
+        Check if a file has been processed.
+
+        With a digest, a known filename only counts if its content is
+        unchanged (except in RUN_ONCE_FOLDERS, where the name is enough),
+        and an unknown filename counts if its content is.
+        """
+        with self._lock:
+            names = self.processed.get(folder, {})
+            if filename in names:
+                stored = names[filename]
+                if digest is None or stored is None or stored == digest:
+                    return True
+                if folder in RUN_ONCE_FOLDERS:
+                    return True
+            return digest is not None and digest in self.digests.get(folder, {})
+
+    def mark_processed(
+        self,
+        folder: str,
+        filename: str,
+        digest: Optional[str] = None
+    ) -> None:
         """Mark a file as processed."""
-        key = f"processed_{folder}"
-        if key not in self.state:
-            self.state[key] = []
-        if filename not in self.state[key]:
-            self.state[key].append(filename)
-        # Keep only last 500 entries
-        self.state[key] = self.state[key][-500:]
+        with self._lock:
+            names = self.processed.get(folder, {})
+            if filename not in names or names[filename] != digest:
+                self._append({
+                    "op": "processed",
+                    "folder": folder,
+                    "name": filename,
+                    "digest": digest,
+                })
 
     def increment_stat(self, stat: str) -> None:
         """Increment a statistic counter."""
-        if stat in self.state["stats"]:
-            self.state["stats"][stat] += 1
+        with self._lock:
+            if stat in self.state["stats"]:
+                self._append({"op": "stat", "stat": stat})
+
+
+def content_digest(content: bytes) -> str:
+    """Hash frontmatter + body, ignoring keys Claude updates while working."""
+    if content.startswith(b"---"):
+        lines = content.split(b"\n")
+        for end, line in enumerate(lines[1:], start=1):
+            if line.strip() == b"---":
+                header = [
+                    h for h in lines[1:end]
+                    if h.split(b":", 1)[0].strip().decode("utf-8", "replace")
+                    not in VOLATILE_FRONTMATTER_KEYS
+                ]
+                content = b"\n".join(header + lines[end:])
+                break
+    return hashlib.sha256(content).hexdigest()
+
+
+class ClaudeRunner:
+    """
+    Supervise `claude --print` subprocesses from a single asyncio loop.
 
+    The loop lives on one background thread. Callers on any thread submit a
+    prompt with run() and block on the result while stdout is streamed line
+    by line into the orchestrator log. Runs that pass the soft deadline are
+    reported; runs that pass the hard deadline, or are still going when the
+    runner shuts down, are killed.
+    """
 
-def parse_frontmatter(content: str) -> dict:
-    """Extract YAML frontmatter from markdown content."""
-    frontmatter = {}
-    if content.startswith("---"):
-        parts = content.split("---", 2)
-        if len(parts) >= 3:
-            for line in parts[1].strip().split("\n"):
-                if ":" in line:
-                    key, value = line.split(":", 1)
-                    frontmatter[key.strip()] = value.strip()
-    return frontmatter
+    def __init__(
+        self,
+        logger: logging.Logger,
+        soft_timeout: float = CLAUDE_SOFT_TIMEOUT,
+        hard_timeout: float = CLAUDE_HARD_TIMEOUT
+    ):
+        self.logger = logger
+        self.soft_timeout = soft_timeout
+        self.hard_timeout = hard_timeout
+        self._procs: set[asyncio.subprocess.Process] = set()
+        self._closing = False
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="claude-runner", daemon=True
+        )
+        self._thread.start()
+
+    def run(self, vault_path: Path, prompt: str, label: str = "claude") -> tuple[bool, str]:
+        """Run Claude with a prompt and wait for (success, output)."""
+        if self._closing:
+            return False, "Shutting down"
+        future = asyncio.run_coroutine_threadsafe(
+            self.run_async(vault_path, prompt, label), self._loop
+        )
+        return future.result()
+
+    async def _stream(
+        self,
+        stream: asyncio.StreamReader,
+        lines: list[str],
+        label: Optional[str] = None
+    ) -> None:
+        """Collect lines from a pipe, logging them as they arrive if labelled."""
+        async for raw in stream:
+            line = raw.decode("utf-8", errors="replace").rstrip("\n")
+            lines.append(line)
+            if label and line.strip():
+                self.logger.info(f"  [{label}] {line}")
+
+    async def run_async(
+        self,
+        vault_path: Path,
+        prompt: str,
+        label: str = "claude"
+    ) -> tuple[bool, str]:
+        """Coroutine behind run(); must be awaited on the runner's loop."""
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *CLAUDE_COMMAND,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=str(vault_path),
+                limit=CLAUDE_LINE_LIMIT,
+                # Own process group so MCP servers claude spawns die with it
+                start_new_session=(os.name == "posix"),
+            )
+        except FileNotFoundError:
+            self.logger.error("Claude Code not found. Is it installed and in PATH?")
+            return False, "Claude not found"
+        except Exception as e:
+            self.logger.error(f"Error calling Claude: {e}")
+            return False, str(e)
+
+        self._procs.add(proc)
+        stdout_lines: list[str] = []
+        stderr_lines: list[str] = []
+
+        try:
+            proc.stdin.write(prompt.encode("utf-8"))
+            await proc.stdin.drain()
+            proc.stdin.close()
+
+            run = asyncio.ensure_future(asyncio.gather(
+                self._stream(proc.stdout, stdout_lines, label),
+                self._stream(proc.stderr, stderr_lines),
+                proc.wait(),
+            ))
+
+            done, _ = await asyncio.wait({run}, timeout=self.soft_timeout)
+            if not done:
+                self.logger.warning(
+                    f"Claude still running for {label} after {self.soft_timeout}s"
+                )
+                done, _ = await asyncio.wait(
+                    {run}, timeout=max(0, self.hard_timeout - self.soft_timeout)
+                )
+
+            timed_out = not done
+            if timed_out:
+                self._kill(proc)
+            await run
+
+            if timed_out:
+                self.logger.error(
+                    f"Claude timed out after {self.hard_timeout}s on {label}, killed"
+                )
+                return False, "Timeout"
+
+        except Exception as e:
+            self._kill(proc)
+            self.logger.error(f"Error calling Claude: {e}")
+            return False, str(e)
+
+        finally:
+            self._procs.discard(proc)
+
+        if proc.returncode == 0:
+            # Finished on its own, even if shutdown started meanwhile
+            return True, "\n".join(stdout_lines)
+
+        if self._closing and proc.returncode < 0:
+            self.logger.warning(f"Claude run for {label} cancelled on shutdown")
+            return False, "Cancelled"
+
+        stderr = "\n".join(stderr_lines)
+        self.logger.error(f"Claude returned error: {stderr}")
+        return False, stderr
+
+    def _kill(self, proc: asyncio.subprocess.Process) -> None:
+        """Kill a run along with any children still holding its pipes."""
+        if proc.returncode is not None:
+            return
+        with contextlib.suppress(ProcessLookupError):
+            if os.name == "posix":
+                os.killpg(proc.pid, signal.SIGKILL)
+            else:
+                proc.kill()
+
+    async def _kill_all(self) -> None:
+        """Kill every running process and wait for their runs to wind down."""
+        for proc in list(self._procs):
+            self._kill(proc)
+        while self._procs:
+            await asyncio.sleep(0.05)
+
+    def shutdown(self, timeout: float = 10) -> None:
+        """Kill any running Claude processes and stop the loop."""
+        self._closing = True
+        if self._procs:
+            self.logger.info(f"Killing {len(self._procs)} running Claude process(es)")
+        future = asyncio.run_coroutine_threadsafe(self._kill_all(), self._loop)
+        with contextlib.suppress(TimeoutError):
+            future.result(timeout)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+
+
+_claude_runner: Optional[ClaudeRunner] = None
+_claude_runner_closed = False
+_claude_runner_lock = threading.Lock()
+
+
+def get_claude_runner(logger: logging.Logger) -> Optional[ClaudeRunner]:
+    """
+    Return the process-wide ClaudeRunner, starting it on first use.
+
+    Returns None once shutdown_claude_runner() has been called, so no new
+    Claude process is started while the orchestrator is stopping.
+    """
+    global _claude_runner
+    with _claude_runner_lock:
+        if _claude_runner_closed:
+            return None
+        if _claude_runner is None:
+            _claude_runner = ClaudeRunner(logger)
+        return _claude_runner
+
+
+def shutdown_claude_runner() -> None:
+    """Stop the process-wide ClaudeRunner if one was started, for good."""
+    global _claude_runner, _claude_runner_closed
+    with _claude_runner_lock:
+        _claude_runner_closed = True
+        if _claude_runner is not None:
+            _claude_runner.shutdown()
+            _claude_runner = None
 
 
 def call_claude(
     vault_path: Path,
     prompt: str,
     logger: logging.Logger,
-    dry_run: bool = False
+    dry_run: bool = False,
+    label: str = "claude"
 ) -> tuple[bool, str]:
     """
     Call Claude Code with a prompt.
@@ -140,33 +572,11 @@ def call_claude(
         logger.info(f"[DRY RUN] Would call Claude with prompt:\n{prompt[:200]}...")
         return True, "Dry run - no action taken"
 
-    try:
-        result = subprocess.run(
-            ["claude", "--print"],
-            input=prompt,
-            capture_output=True,
-            text=True,
-            cwd=str(vault_path),
-            timeout=300,  # 5 minute timeout
-        )
-
-        if result.returncode == 0:
-            return True, result.stdout
-        else:
-            logger.error(f"Claude returned error: {result.stderr}")
-            return False, result.stderr
-
-    except subprocess.TimeoutExpired:
-        logger.error("Claude timed out after 5 minutes")
-        return False, "Timeout"
-
-    except FileNotFoundError:
-        logger.error("Claude Code not found. Is it installed and in PATH?")
-        return False, "Claude not found"
-
-    except Exception as e:
-        logger.error(f"Error calling Claude: {e}")
-        return False, str(e)
+    runner = get_claude_runner(logger)
+    if runner is None:
+        logger.warning(f"Not starting Claude for {label}: shutting down")
+        return False, "Shutting down"
+    return runner.run(vault_path, prompt, label)
 
 
 def process_needs_action(
@@ -193,7 +603,9 @@ Process the file at Needs_Action/{file_path.name}
 Be concise. Report what was done.
 """
 
-    success, output = call_claude(vault_path, prompt, logger, dry_run)
+    success, output = call_claude(
+        vault_path, prompt, logger, dry_run, label=file_path.name
+    )
 
     if success:
         logger.info(f"Processed: {file_path.name}")
@@ -203,6 +615,71 @@ Be concise. Report what was done.
     return success
 
 
+BATCH_RESULT_RE = re.compile(r"^RESULT\s+(.+?)\s+(OK|FAILED)\b", re.MULTILINE)
+
+
+def process_needs_action_batch(
+    file_paths: list[Path],
+    vault_path: Path,
+    logger: logging.Logger,
+    dry_run: bool = False
+) -> Optional[dict[str, bool]]:
+    """
+    Process several /Needs_Action files in a single Claude call.
+
+    Returns {filename: success} for every file Claude reported on, or None
+    if the call failed or its output did not follow the result contract.
+    """
+    names = [file_path.name for file_path in file_paths]
+    logger.info(f"Processing batch of {len(names)}: {', '.join(names)}")
+
+    file_list = "\n".join(f"- Needs_Action/{name}" for name in names)
+    prompt = f"""
+Process each of these files:
+
+{file_list}
+
+1. Read Company_Handbook.md once for the priority keywords
+2. For each file, use the file-processing skill to:
+   - Classify priority
+   - Create a summary
+   - Determine if any follow-up actions are needed
+   If it is a multi-step task, use task-planner skill to create a plan in /Plans
+   Move the processed file to /Done with DONE_ prefix
+3. Update Dashboard.md once with all the actions
+
+Be concise. End your reply with exactly one line per file, in this form:
+RESULT <filename> OK
+RESULT <filename> FAILED <short reason>
+"""
+
+    success, output = call_claude(
+        vault_path, prompt, logger, dry_run, label=f"batch of {len(names)}"
+    )
+
+    if not success:
+        logger.error(f"Failed to process batch: {', '.join(names)}")
+        return None
+    if dry_run:
+        return dict.fromkeys(names, True)
+
+    results = {
+        name: status == "OK"
+        for name, status in BATCH_RESULT_RE.findall(output)
+        if name in names
+    }
+    if not results:
+        logger.warning("Batch output had no RESULT lines")
+        return None
+
+    for name, ok in results.items():
+        if ok:
+            logger.info(f"Processed: {name}")
+        else:
+            logger.error(f"Failed to process: {name}")
+    return results
+
+
 def execute_approved_action(
     file_path: Path,
     vault_path: Path,
@@ -214,8 +691,7 @@ def execute_approved_action(
 
     # Read the file to understand what action to take
     try:
-        content = file_path.read_text(encoding="utf-8")
-        frontmatter = parse_frontmatter(content)
+        frontmatter = read_frontmatter(file_path)
     except Exception as e:
         logger.error(f"Could not read {file_path.name}: {e}")
         return False
@@ -283,7 +759,9 @@ An action has been approved.
 Report the result.
 """
 
-    success, output = call_claude(vault_path, prompt, logger, dry_run)
+    success, output = call_claude(
+        vault_path, prompt, logger, dry_run, label=file_path.name
+    )
 
     if success:
         logger.info(f"Executed: {file_path.name} ({action_type})")
@@ -303,25 +781,547 @@ def scan_folder(folder: Path) -> list[Path]:
     ]
 
 
+class FolderCache:
+    """
+    Remember folder listings keyed by the directory's inode and mtime.
+
+    Adding, removing or renaming a file bumps the directory's mtime, so an
+    unchanged folder costs a single stat and is skipped. Editing a file in
+    place does not, so each folder is still rechecked file by file every
+    FOLDER_RESCAN_INTERVAL seconds (from the cached listing when the
+    directory is unchanged) to catch edits and retry failed files.
+    """
+
+    def __init__(self, rescan_interval: float = FOLDER_RESCAN_INTERVAL):
+        self.rescan_interval = rescan_interval
+        # folder -> ((st_ino, st_mtime_ns), files, monotonic time of last check)
+        self._entries: dict[Path, tuple[tuple[int, int], list[Path], float]] = {}
+
+    def scan(self, folder: Path) -> Optional[list[Path]]:
+        """Return the folder's files, or None if it is unchanged since last time."""
+        try:
+            st = folder.stat()
+        except OSError:
+            self._entries.pop(folder, None)
+            return []
+
+        key = (st.st_ino, st.st_mtime_ns)
+        now = time.monotonic()
+        entry = self._entries.get(folder)
+        # Coarse filesystem timestamps can hide a change made in the same tick
+        unchanged = (
+            entry is not None
+            and entry[0] == key
+            and time.time() - st.st_mtime > DIR_MTIME_SLACK
+        )
+
+        if unchanged and now - entry[2] < self.rescan_interval:
+            return None
+
+        files = entry[1] if unchanged else scan_folder(folder)
+        self._entries[folder] = (key, files, now)
+        return files
+
+
+# Watched folders: state key -> (vault subfolder, handler, stat counter)
+WATCHED_FOLDERS = {
+    "needs_action": ("Needs_Action", process_needs_action, "needs_action_processed"),
+    "approved": ("Approved", execute_approved_action, "approved_executed"),
+}
+
+
+def dispatch_file(
+    folder: str,
+    file_path: Path,
+    state: OrchestratorState,
+    vault_path: Path,
+    logger: logging.Logger,
+    dry_run: bool = False
+) -> bool:
+    """
+    Run the handler for a file if it has not been processed yet.
+
+    Returns True if the file was handled (successfully or not).
+    """
+    # Hash before the handler runs; Claude may edit or move the file
+    digest = state.digest(file_path)
+    if state.is_processed(folder, file_path.name, digest):
+        return False
+
+    _, handler, stat = WATCHED_FOLDERS[folder]
+
+    if folder == "needs_action":
+        logger.info(f"New item in Needs_Action: {file_path.name}")
+    else:
+        logger.info(f"New approved action: {file_path.name}")
+
+    success = handler(file_path, vault_path, logger, dry_run)
+
+    if success or dry_run:
+        state.mark_processed(folder, file_path.name, digest)
+        state.increment_stat(stat)
+    else:
+        state.increment_stat("errors")
+
+    state.save()
+    return True
+
+
+def dispatch_batch(
+    file_paths: list[Path],
+    state: OrchestratorState,
+    vault_path: Path,
+    logger: logging.Logger,
+    dry_run: bool = False
+) -> None:
+    """
+    Process several Needs_Action files with one Claude call.
+
+    Files the batch did not report on are retried one at a time.
+    """
+    digests = {}
+    for file_path in file_paths:
+        digest = state.digest(file_path)
+        if not state.is_processed("needs_action", file_path.name, digest):
+            digests[file_path] = digest
+
+    batch = list(digests)
+    if len(batch) < 2:
+        for file_path in batch:
+            dispatch_file("needs_action", file_path, state, vault_path, logger, dry_run)
+        return
+
+    for file_path in batch:
+        logger.info(f"New item in Needs_Action: {file_path.name}")
+
+    results = process_needs_action_batch(batch, vault_path, logger, dry_run) or {}
+
+    for file_path in batch:
+        success = results.get(file_path.name)
+        if success is None:
+            if file_path.exists():
+                logger.info(f"No batch result for {file_path.name}, retrying alone")
+                dispatch_file(
+                    "needs_action", file_path, state, vault_path, logger, dry_run
+                )
+                continue
+            # Claude already moved it to /Done without reporting
+            success = True
+
+        if success:
+            state.mark_processed("needs_action", file_path.name, digests[file_path])
+            state.increment_stat("needs_action_processed")
+        else:
+            state.increment_stat("errors")
+
+    state.save()
+
+
+# Lower is more urgent; matches the priority: values GmailWatcher writes
+PRIORITY_LEVELS = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+
+# Fallback priority by type: for items without a priority: field
+TYPE_PRIORITY = {
+    "email": "medium",
+    "file_drop": "low",
+}
+
+
+def safe_frontmatter(file_path: Path) -> dict:
+    """Read a file's frontmatter, or {} if it cannot be read."""
+    try:
+        return read_frontmatter(file_path)
+    except OSError:
+        return {}
+
+
+def item_priority(frontmatter: dict, classifier: Optional[PriorityClassifier] = None) -> int:
+    """
+    Map frontmatter such as 'priority: 🔴 critical' to a PRIORITY_LEVELS value.
+
+    Items without a priority are classified by the keywords in their
+    subject or original file name, then by their type.
+    """
+    for word in str(frontmatter.get("priority", "")).lower().split():
+        if word in PRIORITY_LEVELS:
+            return PRIORITY_LEVELS[word]
+    if classifier is not None:
+        title = str(frontmatter.get("subject") or frontmatter.get("original_name") or "")
+        level = classifier.classify(re.sub(r"[_.]+", " ", title), default=None)
+        if level is not None:
+            return PRIORITY_LEVELS[level]
+    fallback = TYPE_PRIORITY.get(frontmatter.get("type", ""), "medium")
+    return PRIORITY_LEVELS[fallback]
+
+
+class PriorityFileQueue:
+    """
+    Files waiting in one folder, most urgent first.
+
+    Critical items always go first, in arrival order. Every other item is
+    ranked by its level minus one level per PRIORITY_AGING seconds waited,
+    so a low item left behind a stream of new high ones is promoted in
+    time. Aging never lifts an item above critical, so critical latency
+    does not depend on how big the backlog is. Because every item ages at
+    the same rate, the rank can be stored at push time.
+    """
+
+    def __init__(self, aging: float = PRIORITY_AGING):
+        self.aging = aging
+        self._heap: list[tuple[int, float, int, Path, str]] = []
+        self._seq = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, file_path: Path, level: int, batch_key: str = "") -> None:
+        now = time.monotonic()
+        if level == PRIORITY_LEVELS["critical"]:
+            entry = (0, now, next(self._seq), file_path, batch_key)
+        else:
+            entry = (1, level * self.aging + now, next(self._seq), file_path, batch_key)
+        heapq.heappush(self._heap, entry)
+
+    def pop_batch(self, limit: int = 1) -> list[Path]:
+        """Pop the most urgent file plus up to limit - 1 more with its batch key."""
+        first = heapq.heappop(self._heap)
+        batch = [first]
+        if limit > 1:
+            matches = heapq.nsmallest(
+                limit - 1, (entry for entry in self._heap if entry[4] == first[4])
+            )
+            if matches:
+                taken = {entry[2] for entry in matches}
+                self._heap = [entry for entry in self._heap if entry[2] not in taken]
+                heapq.heapify(self._heap)
+                batch.extend(matches)
+        return [entry[3] for entry in batch]
+
+    def clear(self) -> None:
+        self._heap.clear()
+
+
+class WorkerPool:
+    """
+    Run folder handlers on a bounded set of worker threads.
+
+    Each watched folder has its own PriorityFileQueue. Idle workers take from
+    the folders in round-robin order, so a backlog in Needs_Action cannot
+    starve Approved actions (and vice versa). With batch_size > 1, a worker taking
+    a Needs_Action file also takes queued files of the same type, up to
+    batch_size, and processes them in a single Claude call.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        state: OrchestratorState,
+        vault_path: Path,
+        logger: logging.Logger,
+        dry_run: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ):
+        self.state = state
+        self.vault_path = vault_path
+        self.logger = logger
+        self.dry_run = dry_run
+        self.batch_size = max(1, batch_size)
+
+        self._queues: dict[str, PriorityFileQueue] = {
+            folder: PriorityFileQueue() for folder in WATCHED_FOLDERS
+        }
+        self._folders = list(self._queues)
+        self._next_folder = 0
+        self._pending: set[tuple[str, str]] = set()
+        self._active = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+        self._threads = [
+            threading.Thread(
+                target=self._worker, name=f"orchestrator-worker-{i}", daemon=True
+            )
+            for i in range(max(1, workers))
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, folder: str, file_path: Path) -> bool:
+        """
+        Queue a file for processing.
+
+        Returns False if it is already processed, queued or in flight.
+        """
+        return self.submit_many([(folder, file_path)]) == 1
+
+    def submit_many(self, items: list[tuple[str, Path]]) -> int:
+        """
+        Queue several files at once so workers see every folder's share.
+
+        Returns the number of files actually queued.
+        """
+        # Read outside the lock; unchanged files hit the state's stat cache
+        digests = [self.state.digest(file_path) for _, file_path in items]
+        headers = [safe_frontmatter(file_path) for _, file_path in items]
+        classifier = get_classifier(self.vault_path / "Company_Handbook.md")
+        levels = [item_priority(frontmatter, classifier) for frontmatter in headers]
+
+        queued = 0
+        with self._cond:
+            if self._closed:
+                return 0
+            for (folder, file_path), digest, frontmatter, level in zip(items, digests, headers, levels):
+                key = (folder, file_path.name)
+                if key in self._pending:
+                    continue
+                if self.state.is_processed(folder, file_path.name, digest):
+                    if not self.state.is_processed(folder, file_path.name):
+                        self.logger.info(
+                            f"Skipping {file_path.name}: same content already processed"
+                        )
+                        self.state.mark_processed(folder, file_path.name, digest)
+                    continue
+                self._pending.add(key)
+                self._queues[folder].push(
+                    file_path,
+                    level,
+                    batch_key=str(frontmatter.get("type", "")),
+                )
+                queued += 1
+            if queued:
+                self._cond.notify_all()
+        return queued
+
+    def _take(self) -> Optional[tuple[str, list[Path]]]:
+        """Pop the next file(s), rotating across folders. Caller holds the lock."""
+        for offset in range(len(self._folders)):
+            index = (self._next_folder + offset) % len(self._folders)
+            folder = self._folders[index]
+            queue = self._queues[folder]
+            if queue:
+                self._next_folder = (index + 1) % len(self._folders)
+                limit = self.batch_size if folder == "needs_action" else 1
+                return folder, queue.pop_batch(limit)
+        return None
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                item = self._take()
+                while item is None and not self._closed:
+                    self._cond.wait()
+                    item = self._take()
+                if item is None:
+                    return
+                self._active += 1
+
+            folder, batch = item
+            batch = [file_path for file_path in batch if file_path.exists()]
+            try:
+                if len(batch) > 1:
+                    dispatch_batch(
+                        batch, self.state, self.vault_path, self.logger, self.dry_run
+                    )
+                elif batch:
+                    dispatch_file(
+                        folder, batch[0], self.state,
+                        self.vault_path, self.logger, self.dry_run
+                    )
+            except Exception as e:
+                names = ", ".join(file_path.name for file_path in batch)
+                self.logger.error(f"Worker error on {names}: {e}")
+            finally:
+                with self._cond:
+                    self._active -= 1
+                    for file_path in item[1]:
+                        self._pending.discard((folder, file_path.name))
+                    self._cond.notify_all()
+
+    def join(self) -> None:
+        """Block until every queued file has been handled."""
+        with self._cond:
+            while self._active or any(self._queues.values()):
+                self._cond.wait()
+
+    def close(self) -> None:
+        """Drop queued work and stop workers from taking more."""
+        with self._cond:
+            self._closed = True
+            for queue in self._queues.values():
+                queue.clear()
+            self._cond.notify_all()
+
+    def shutdown(self) -> None:
+        """Close the pool and wait for in-flight files to finish."""
+        self.close()
+        for thread in self._threads:
+            thread.join()
+
+
+def sweep_folders(
+    pool: WorkerPool,
+    vault_path: Path,
+    cache: Optional[FolderCache] = None
+) -> int:
+    """
+    Scan every watched folder once and queue unprocessed files.
+
+    With a cache, folders that have not changed since the last sweep are skipped.
+    """
+    items = []
+    for folder, (subfolder, _, _) in WATCHED_FOLDERS.items():
+        folder_path = vault_path / subfolder
+        files = cache.scan(folder_path) if cache else scan_folder(folder_path)
+        for file_path in files or ():
+            items.append((folder, file_path))
+    return pool.submit_many(items)
+
+
+class VaultEventHandler(FileSystemEventHandler):
+    """
+    Queue markdown files as soon as they land in a watched vault folder.
+
+    A created file is queued once its writer closes it, or after
+    settle_seconds without further writes, so its priority and type are
+    read from the finished header rather than an empty or partial file.
+    Moved-in files are complete already and are queued at once.
+    """
+
+    def __init__(
+        self,
+        folder: str,
+        pool: WorkerPool,
+        settle_seconds: float = EVENT_SETTLE_SECONDS
+    ):
+        self.folder = folder
+        self.pool = pool
+        self.settle_seconds = settle_seconds
+        self._settling: dict[Path, threading.Timer] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _wanted(file_path: Path) -> bool:
+        return file_path.suffix == ".md" and not file_path.name.startswith(".")
+
+    def _settle(self, file_path: Path) -> None:
+        """(Re)start the quiet-time countdown for a file still being written."""
+        timer = threading.Timer(self.settle_seconds, self._enqueue, (file_path,))
+        timer.daemon = True
+        with self._lock:
+            previous = self._settling.get(file_path)
+            self._settling[file_path] = timer
+        if previous is not None:
+            previous.cancel()
+        timer.start()
+
+    def _enqueue(self, file_path: Path) -> None:
+        with self._lock:
+            timer = self._settling.pop(file_path, None)
+        if timer is not None:
+            timer.cancel()
+        self.pool.submit(self.folder, file_path)
+
+    def on_created(self, event: FileSystemEvent):
+        file_path = Path(event.src_path)
+        if not event.is_directory and self._wanted(file_path):
+            self._settle(file_path)
+
+    def on_modified(self, event: FileSystemEvent):
+        # Only files still being written; later edits wait for the next sweep
+        file_path = Path(event.src_path)
+        if not event.is_directory and file_path in self._settling:
+            self._settle(file_path)
+
+    def on_closed(self, event: FileSystemEvent):
+        file_path = Path(event.src_path)
+        if not event.is_directory and file_path in self._settling:
+            self._enqueue(file_path)
+
+    def on_moved(self, event: FileSystemEvent):
+        # Approvals arrive as a move from /Pending_Approval into /Approved,
+        # and atomic writers rename a finished temp file into place
+        if event.is_directory:
+            return
+        with self._lock:
+            timer = self._settling.pop(Path(event.src_path), None)
+        if timer is not None:
+            timer.cancel()
+        file_path = Path(event.dest_path)
+        if self._wanted(file_path):
+            self._enqueue(file_path)
+
+    def close(self) -> None:
+        """Cancel countdowns for files not queued yet (the next sweep finds them)."""
+        with self._lock:
+            timers, self._settling = list(self._settling.values()), {}
+        for timer in timers:
+            timer.cancel()
+
+
+def run_event_driven(
+    pool: WorkerPool,
+    vault_path: Path,
+    reconcile_interval: int,
+    logger: logging.Logger
+) -> None:
+    """
+    Dispatch files the moment they land in a watched folder.
+
+    A full folder sweep still runs every reconcile_interval seconds to pick up
+    anything the observer missed (e.g. files dropped while we were down).
+    """
+    observer = Observer()
+    handlers = []
+    for folder, (subfolder, _, _) in WATCHED_FOLDERS.items():
+        handler = VaultEventHandler(folder, pool)
+        handlers.append(handler)
+        observer.schedule(handler, str(vault_path / subfolder), recursive=False)
+    observer.start()
+    cache = FolderCache()
+
+    try:
+        # Initial sweep catches everything that arrived before we started
+        sweep_folders(pool, vault_path, cache)
+
+        while True:
+            time.sleep(reconcile_interval)
+            queued = sweep_folders(pool, vault_path, cache)
+            if queued:
+                logger.info(f"Reconciliation sweep picked up {queued} file(s)")
+    finally:
+        observer.stop()
+        observer.join()
+        for handler in handlers:
+            handler.close()
+
+
 def run_orchestrator(
     vault_path: Path,
     interval: int,
     dry_run: bool,
-    logger: logging.Logger
+    logger: logging.Logger,
+    event_driven: bool = False,
+    reconcile_interval: int = DEFAULT_RECONCILE_INTERVAL,
+    workers: int = DEFAULT_WORKERS,
+    batch_size: int = DEFAULT_BATCH_SIZE
 ) -> None:
     """Main orchestrator loop."""
 
     state_file = vault_path / STATE_FILE
-    state = OrchestratorState(state_file)
-
-    needs_action_path = vault_path / "Needs_Action"
-    approved_path = vault_path / "Approved"
+    state = OrchestratorState(state_file, vault_path)
+    pool = WorkerPool(workers, state, vault_path, logger, dry_run, batch_size)
 
     logger.info("=" * 50)
     logger.info("AI Employee Orchestrator (Silver Tier)")
     logger.info("=" * 50)
     logger.info(f"Vault path: {vault_path}")
-    logger.info(f"Check interval: {interval}s")
+    if event_driven:
+        logger.info("Mode: event-driven")
+        logger.info(f"Reconcile interval: {reconcile_interval}s")
+    else:
+        logger.info(f"Check interval: {interval}s")
+    logger.info(f"Workers: {workers}")
+    logger.info(f"Batch size: {batch_size}")
     logger.info(f"Dry run: {dry_run}")
     logger.info(f"State file: {state_file}")
     logger.info("=" * 50)
@@ -329,50 +1329,24 @@ def run_orchestrator(
     logger.info("")
 
     try:
-        while True:
-            # Check /Needs_Action
-            needs_action_files = scan_folder(needs_action_path)
-            for file_path in needs_action_files:
-                if not state.is_processed("needs_action", file_path.name):
-                    logger.info(f"New item in Needs_Action: {file_path.name}")
-
-                    success = process_needs_action(
-                        file_path, vault_path, logger, dry_run
-                    )
-
-                    if success or dry_run:
-                        state.mark_processed("needs_action", file_path.name)
-                        state.increment_stat("needs_action_processed")
-                    else:
-                        state.increment_stat("errors")
-
-                    state.save()
-
-            # Check /Approved
-            approved_files = scan_folder(approved_path)
-            for file_path in approved_files:
-                if not state.is_processed("approved", file_path.name):
-                    logger.info(f"New approved action: {file_path.name}")
-
-                    success = execute_approved_action(
-                        file_path, vault_path, logger, dry_run
-                    )
-
-                    if success or dry_run:
-                        state.mark_processed("approved", file_path.name)
-                        state.increment_stat("approved_executed")
-                    else:
-                        state.increment_stat("errors")
-
-                    state.save()
+        if event_driven:
+            run_event_driven(pool, vault_path, reconcile_interval, logger)
+        else:
+            cache = FolderCache()
+            while True:
+                sweep_folders(pool, vault_path, cache)
 
-            # Sleep until next check
-            time.sleep(interval)
+                # Sleep until next check
+                time.sleep(interval)
 
     except KeyboardInterrupt:
         logger.info("")
         logger.info("Shutting down orchestrator...")
-        state.save()
+        # Stop workers taking new files before killing the running ones
+        pool.close()
+        shutdown_claude_runner()
+        pool.shutdown()
+        state.close()
         logger.info(f"Stats: {json.dumps(state.state['stats'])}")
         logger.info("Goodbye!")
 
@@ -393,6 +1367,38 @@ def main():
         default=DEFAULT_INTERVAL,
         help=f"Check interval in seconds (default: {DEFAULT_INTERVAL})",
     )
+    parser.add_argument(
+        "--event-driven",
+        action="store_true",
+        help="React to new files immediately instead of polling",
+    )
+    parser.add_argument(
+        "--reconcile-interval",
+        type=int,
+        default=DEFAULT_RECONCILE_INTERVAL,
+        help=(
+            "Full sweep interval in event-driven mode "
+            f"(default: {DEFAULT_RECONCILE_INTERVAL})"
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=(
+            "Number of Claude invocations to run concurrently "
+            f"(default: {DEFAULT_WORKERS})"
+        ),
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=(
+            "Max Needs_Action files of the same type per Claude call "
+            f"(default: {DEFAULT_BATCH_SIZE}, no batching)"
+        ),
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -424,28 +1430,33 @@ def main():
         logger.info("Running single check...")
 
         state_file = vault_path / STATE_FILE
-        state = OrchestratorState(state_file)
+        state = OrchestratorState(state_file, vault_path)
 
-        needs_action_path = vault_path / "Needs_Action"
-        approved_path = vault_path / "Approved"
-
-        # Process Needs_Action
-        for file_path in scan_folder(needs_action_path):
-            if not state.is_processed("needs_action", file_path.name):
-                process_needs_action(file_path, vault_path, logger, args.dry_run)
-                state.mark_processed("needs_action", file_path.name)
-
-        # Process Approved
-        for file_path in scan_folder(approved_path):
-            if not state.is_processed("approved", file_path.name):
-                execute_approved_action(file_path, vault_path, logger, args.dry_run)
-                state.mark_processed("approved", file_path.name)
-
-        state.save()
+        pool = WorkerPool(
+            args.workers, state, vault_path, logger, args.dry_run, args.batch_size
+        )
+        try:
+            sweep_folders(pool, vault_path)
+            pool.join()
+        finally:
+            pool.close()
+            shutdown_claude_runner()
+            pool.shutdown()
+
+        state.close()
         logger.info("Single run complete.")
     else:
         # Continuous monitoring mode
-        run_orchestrator(vault_path, args.interval, args.dry_run, logger)
+        run_orchestrator(
+            vault_path,
+            args.interval,
+            args.dry_run,
+            logger,
+            event_driven=args.event_driven,
+            reconcile_interval=args.reconcile_interval,
+            workers=args.workers,
+            batch_size=args.batch_size,
+        )
 
 
 if __name__ == "__main__":
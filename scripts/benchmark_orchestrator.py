@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+Orchestrator Benchmark
+
+Measures how fast orchestrator.py drains a synthetic vault. Builds a
+throwaway vault full of EMAIL_/FILE_/APPROVAL_ files, puts a fake `claude`
+executable first on PATH (configurable latency and failure rate, moves
+files to /Done like the real thing) and runs the orchestrator against it.
+
+Reports throughput, drop-to-Done latency percentiles, the orchestrator's
+own write I/O and peak memory.
+
+Usage:
+    python scripts/benchmark_orchestrator.py
+    python scripts/benchmark_orchestrator.py --emails 2000 --files 1000 --approvals 200
+    python scripts/benchmark_orchestrator.py --latency 2 --failure-rate 0.05 --workers 8
+    python scripts/benchmark_orchestrator.py --mode poll --interval 30
+    python scripts/benchmark_orchestrator.py --batch-size 5 --json
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_PATH = Path(__file__).parent.parent
+ORCHESTRATOR = REPO_PATH / "orchestrator.py"
+EVENTS_LOG = "bench_events.log"
+STARTUP_MARKER = "Starting monitoring loop"
+
+PRIORITIES = ["🔴 critical", "🟠 high", "🟡 medium", "🟢 low"]
+ACTIONS = ["email_send", "social_post", "file_delete"]
+
+# Stand-in for `claude --print`. Reads the prompt, sleeps, then moves every
+# file it mentions to /Done and reports it, or fails the whole call.
+FAKE_CLAUDE = '''#!{python}
+import os, random, re, sys, time
+
+prompt = sys.stdin.read()
+latency = float(os.environ.get("BENCH_LATENCY", "0"))
+jitter = float(os.environ.get("BENCH_JITTER", "0"))
+failure_rate = float(os.environ.get("BENCH_FAILURE_RATE", "0"))
+
+files = dict.fromkeys(re.findall(r"(Needs_Action|Approved)/(\\S+?\\.md)", prompt))
+time.sleep(max(0.0, random.gauss(latency, jitter)))
+failed = random.random() < failure_rate
+
+with open("{events_log}", "a") as log:
+    for folder, name in files:
+        if failed:
+            log.write(f"FAIL {{name}} {{time.time()}}\\n")
+            continue
+        try:
+            os.rename(os.path.join(folder, name), os.path.join("Done", "DONE_" + name))
+        except OSError:
+            pass
+        log.write(f"DONE {{name}} {{time.time()}}\\n")
+        print(f"RESULT {{name}} OK")
+
+sys.exit(1 if failed else 0)
+'''
+
+
+def install_fake_claude(bin_path: Path) -> None:
+    """Write the fake claude executable into bin_path."""
+    bin_path.mkdir(parents=True, exist_ok=True)
+    script = bin_path / "claude"
+    script.write_text(
+        FAKE_CLAUDE.format(python=sys.executable, events_log=EVENTS_LOG),
+        encoding="utf-8",
+    )
+    script.chmod(0o755)
+
+
+def make_vault(vault_path: Path) -> None:
+    """Create the folder layout and handbook the orchestrator expects."""
+    for folder in ["Needs_Action", "Pending_Approval", "Approved", "Done", "memory"]:
+        (vault_path / folder).mkdir(parents=True, exist_ok=True)
+    shutil.copy(REPO_PATH / "Company_Handbook.md", vault_path / "Company_Handbook.md")
+
+
+def synthetic_body(rng: random.Random, size: int) -> str:
+    words = ["invoice", "meeting", "update", "client", "project", "report", "review"]
+    text = []
+    length = 0
+    while length < size:
+        word = rng.choice(words)
+        text.append(word)
+        length += len(word) + 1
+    return " ".join(text)
+
+
+def build_items(args: argparse.Namespace, rng: random.Random) -> list[tuple[str, str, str]]:
+    """Return (folder, filename, content) for every synthetic file, shuffled."""
+    items = []
+    stamp = "20260101_090000"
+
+    for i in range(args.emails):
+        content = f"""---
+type: email
+id: bench{i:06d}
+from: sender{i}@example.com
+subject: Benchmark email {i}
+received: 2026-01-01T09:00:00
+priority: {rng.choice(PRIORITIES)}
+status: pending
+---
+
+# Email: Benchmark email {i}
+
+## Content
+
+{synthetic_body(rng, args.body_bytes)}
+"""
+        items.append(("Needs_Action", f"EMAIL_benchmark_{i:06d}_{stamp}.md", content))
+
+    for i in range(args.files):
+        content = f"""---
+type: file_drop
+original_name: report_{i}.pdf
+original_path: /tmp/AI_Drop/report_{i}.pdf
+size: {rng.randint(1_000, 5_000_000)}
+detected: 2026-01-01 09:00:00
+status: pending
+---
+
+# New File: report_{i}.pdf
+
+{synthetic_body(rng, args.body_bytes // 4)}
+"""
+        items.append(("Needs_Action", f"FILE_report_{i:06d}_{stamp}.md", content))
+
+    for i in range(args.approvals):
+        content = f"""---
+type: approval_request
+action: {rng.choice(ACTIONS)}
+target: recipient{i}@example.com
+created: 2026-01-01 09:00:00
+status: approved
+---
+
+# Approval {i}
+
+{synthetic_body(rng, args.body_bytes // 2)}
+"""
+        items.append(("Approved", f"APPROVAL_benchmark_{i:06d}_{stamp}.md", content))
+
+    rng.shuffle(items)
+    return items
+
+
+def drop_items(
+    vault_path: Path,
+    items: list[tuple[str, str, str]],
+    rate: float
+) -> dict[str, float]:
+    """
+    Write items into the vault, returning their drop times.
+
+    Approvals are written to /Pending_Approval and moved into /Approved,
+    the way a human approves them in Obsidian.
+    """
+    dropped = {}
+    start = time.time()
+    for index, (folder, name, content) in enumerate(items):
+        if rate > 0:
+            delay = start + index / rate - time.time()
+            if delay > 0:
+                time.sleep(delay)
+        if folder == "Approved":
+            staged = vault_path / "Pending_Approval" / name
+            staged.write_text(content, encoding="utf-8")
+            staged.rename(vault_path / "Approved" / name)
+        else:
+            (vault_path / folder / name).write_text(content, encoding="utf-8")
+        dropped[name] = time.time()
+    return dropped
+
+
+def read_events(vault_path: Path) -> dict[str, tuple[str, float]]:
+    """First outcome per file from the fake claude log: name -> (DONE|FAIL, time)."""
+    events = {}
+    log_path = vault_path / EVENTS_LOG
+    if not log_path.exists():
+        return events
+    for line in log_path.read_text(encoding="utf-8").splitlines():
+        parts = line.split()
+        if len(parts) == 3 and parts[1] not in events:
+            events[parts[1]] = (parts[0], float(parts[2]))
+    return events
+
+
+def proc_stats(pid: int) -> dict:
+    """Write I/O and peak RSS of a process from /proc (Linux only)."""
+    stats = {}
+    try:
+        for line in Path(f"/proc/{pid}/io").read_text().splitlines():
+            key, value = line.split(":", 1)
+            if key in ("wchar", "syscw", "write_bytes"):
+                stats[key] = int(value)
+        for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                stats["peak_rss_kb"] = int(line.split()[1])
+    except OSError:
+        pass
+    return stats
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def wait_for_startup(vault_path: Path, proc: subprocess.Popen, timeout: float) -> None:
+    log_path = vault_path / "orchestrator.log"
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"Orchestrator exited early (code {proc.returncode})")
+        if log_path.exists() and STARTUP_MARKER in log_path.read_text(encoding="utf-8"):
+            # Give the observer a moment to register its watches
+            time.sleep(0.5)
+            return
+        time.sleep(0.1)
+    raise RuntimeError("Orchestrator did not start in time")
+
+
+def run_benchmark(args: argparse.Namespace) -> dict:
+    rng = random.Random(args.seed)
+    work_path = Path(tempfile.mkdtemp(prefix="orchestrator_bench_"))
+    vault_path = work_path / "vault"
+    make_vault(vault_path)
+    install_fake_claude(work_path / "bin")
+
+    items = build_items(args, rng)
+
+    env = dict(os.environ)
+    env["PATH"] = f"{work_path / 'bin'}{os.pathsep}{env.get('PATH', '')}"
+    env["BENCH_LATENCY"] = str(args.latency)
+    env["BENCH_JITTER"] = str(args.jitter)
+    env["BENCH_FAILURE_RATE"] = str(args.failure_rate)
+
+    cmd = [
+        sys.executable, str(ORCHESTRATOR),
+        "--vault-path", str(vault_path),
+        "--workers", str(args.workers),
+        "--batch-size", str(args.batch_size),
+        "--interval", str(args.interval),
+    ]
+    if args.mode == "event":
+        cmd.append("--event-driven")
+
+    print(f"[Benchmark] Vault: {vault_path}")
+    print(f"[Benchmark] Items: {len(items)} ({args.emails} emails, "
+          f"{args.files} file drops, {args.approvals} approvals)")
+    print(f"[Benchmark] Command: {' '.join(cmd[1:])}")
+
+    proc = subprocess.Popen(
+        cmd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        wait_for_startup(vault_path, proc, timeout=30)
+
+        first_drop = time.time()
+        dropped = drop_items(vault_path, items, args.drop_rate)
+        print(f"[Benchmark] Dropped {len(dropped)} files in {time.time() - first_drop:.2f}s")
+
+        deadline = time.monotonic() + args.timeout
+        events = {}
+        while time.monotonic() < deadline:
+            events = read_events(vault_path)
+            if len(events) >= len(dropped):
+                break
+            time.sleep(0.2)
+
+        stats = proc_stats(proc.pid)
+    finally:
+        proc.send_signal(signal.SIGINT)
+        try:
+            proc.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+    latencies = [
+        when - dropped[name]
+        for name, (outcome, when) in events.items()
+        if outcome == "DONE" and name in dropped
+    ]
+    failures = sum(1 for outcome, _ in events.values() if outcome == "FAIL")
+    last_event = max((when for _, when in events.values()), default=first_drop)
+    elapsed = max(last_event - first_drop, 1e-9)
+
+    state_files = list((vault_path / "memory").glob("orchestrator_state.*"))
+    result = {
+        "mode": args.mode,
+        "workers": args.workers,
+        "batch_size": args.batch_size,
+        "items": len(dropped),
+        "settled": len(events),
+        "done": len(latencies),
+        "failed": failures,
+        "timed_out": len(dropped) - len(events),
+        "elapsed_s": round(elapsed, 3),
+        "throughput_per_min": round(len(events) / elapsed * 60, 1),
+        "latency_p50_s": round(percentile(latencies, 50), 3),
+        "latency_p95_s": round(percentile(latencies, 95), 3),
+        "latency_p99_s": round(percentile(latencies, 99), 3),
+        "latency_max_s": round(max(latencies, default=0.0), 3),
+        "orchestrator_write_bytes": stats.get("wchar"),
+        "orchestrator_write_calls": stats.get("syscw"),
+        "orchestrator_peak_rss_kb": stats.get("peak_rss_kb"),
+        "state_file_bytes": sum(f.stat().st_size for f in state_files),
+    }
+
+    if args.keep:
+        print(f"[Benchmark] Kept vault at {vault_path}")
+    else:
+        shutil.rmtree(work_path, ignore_errors=True)
+
+    return result
+
+
+def print_report(result: dict) -> None:
+    print()
+    print("=" * 50)
+    print("Orchestrator Benchmark Results")
+    print("=" * 50)
+    print(f"Mode:            {result['mode']} "
+          f"(workers={result['workers']}, batch={result['batch_size']})")
+    print(f"Items:           {result['items']} "
+          f"({result['done']} done, {result['failed']} failed, "
+          f"{result['timed_out']} timed out)")
+    print(f"Elapsed:         {result['elapsed_s']:.2f}s")
+    print(f"Throughput:      {result['throughput_per_min']:.1f} items/min")
+    print(f"Latency p50:     {result['latency_p50_s']:.3f}s")
+    print(f"Latency p95:     {result['latency_p95_s']:.3f}s")
+    print(f"Latency p99:     {result['latency_p99_s']:.3f}s")
+    print(f"Latency max:     {result['latency_max_s']:.3f}s")
+    if result["orchestrator_write_bytes"] is not None:
+        print(f"Writes:          {result['orchestrator_write_bytes']} bytes in "
+              f"{result['orchestrator_write_calls']} calls")
+    if result["orchestrator_peak_rss_kb"] is not None:
+        print(f"Peak RSS:        {result['orchestrator_peak_rss_kb'] / 1024:.1f} MB")
+    print(f"State on disk:   {result['state_file_bytes']} bytes")
+    print("=" * 50)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark orchestrator throughput and latency on a synthetic vault"
+    )
+    parser.add_argument("--emails", type=int, default=500, help="EMAIL_ files (default: 500)")
+    parser.add_argument("--files", type=int, default=300, help="FILE_ files (default: 300)")
+    parser.add_argument("--approvals", type=int, default=100, help="APPROVAL_ files (default: 100)")
+    parser.add_argument(
+        "--body-bytes", type=int, default=2000,
+        help="Approximate email body size (default: 2000)",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.05,
+        help="Mean fake claude latency in seconds (default: 0.05)",
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.01,
+        help="Std deviation of fake claude latency (default: 0.01)",
+    )
+    parser.add_argument(
+        "--failure-rate", type=float, default=0.0,
+        help="Fraction of fake claude calls that fail (default: 0)",
+    )
+    parser.add_argument(
+        "--mode", choices=["event", "poll"], default="event",
+        help="Orchestrator mode to benchmark (default: event)",
+    )
+    parser.add_argument(
+        "--interval", type=int, default=30,
+        help="Orchestrator --interval in poll mode (default: 30)",
+    )
+    parser.add_argument("--workers", type=int, default=4, help="Orchestrator --workers (default: 4)")
+    parser.add_argument(
+        "--batch-size", type=int, default=1,
+        help="Orchestrator --batch-size (default: 1)",
+    )
+    parser.add_argument(
+        "--drop-rate", type=float, default=0,
+        help="Files dropped per second, 0 for all at once (default: 0)",
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=600,
+        help="Give up waiting after this many seconds (default: 600)",
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    parser.add_argument("--keep", action="store_true", help="Keep the synthetic vault")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+
+    args = parser.parse_args()
+
+    result = run_benchmark(args)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print_report(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -28,6 +28,11 @@ except ImportError:
 
 from dotenv import load_dotenv
 
+# Allow importing the shared vault helpers when run as a script
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from common.frontmatter import split_frontmatter
+
 load_dotenv()
 
 # Paths
@@ -68,15 +73,7 @@ def extract_post_content(file_path: Path) -> tuple[str, dict]:
     content = file_path.read_text(encoding="utf-8")
 
     # Extract frontmatter
-    frontmatter = {}
-    if content.startswith("---"):
-        parts = content.split("---", 2)
-        if len(parts) >= 3:
-            for line in parts[1].strip().split("\n"):
-                if ":" in line:
-                    key, value = line.split(":", 1)
-                    frontmatter[key.strip()] = value.strip()
-            content = parts[2]
+    frontmatter, content = split_frontmatter(content)
 
     # Find the post content between ## Preview and the next ---
     preview_match = re.search(r"## Preview\s*\n(.*?)(?=\n---|\n## )", content, re.DOTALL)
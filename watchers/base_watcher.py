@@ -1,14 +1,42 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
-import time
+from queue import Empty, Queue
+import random
 
 
 class BaseWatcher(ABC):
-    """Abstract base class for all watchers."""
+    """Abstract base class for all watchers.
 
-    def __init__(self, dry_run: bool = False):
+    run() is a blocking dispatcher: between polls it waits on the `events`
+    queue, so anything put there (wake() puts None) is handled at once and
+    an idle watcher sleeps without waking. Everything queued by the time it
+    wakes goes to handle_event() before a single poll. Watchers with an
+    interval also poll on an adaptive schedule: the wait halves (down to
+    min_interval) after a poll that found items and grows by half (up to
+    max_interval) after an idle one. Consecutive errors back off
+    exponentially with jitter, from error_backoff_base up to
+    error_backoff_max.
+    """
+
+    idle_growth = 1.5  # interval multiplier after a poll with no items
+    busy_shrink = 0.5  # interval multiplier after a poll that found items
+    error_backoff_base = 5.0  # seconds before the first retry after an error
+    error_backoff_max = 600.0  # cap on the error backoff
+
+    def __init__(
+        self,
+        dry_run: bool = False,
+        interval: float | None = 1.0,
+        min_interval: float | None = None,
+        max_interval: float | None = None,
+    ):
+        """interval=None means no periodic polling: only events wake the watcher."""
         self.dry_run = dry_run
         self.running = False
+        self.interval = interval
+        self.min_interval = min_interval if min_interval is not None else interval
+        self.max_interval = max_interval if max_interval is not None else interval
+        self.events: Queue = Queue()
 
     @abstractmethod
     def check_for_updates(self) -> list:
@@ -31,25 +59,87 @@ class BaseWatcher(ABC):
         """
         pass
 
+    def poll_once(self) -> int:
+        """Check once and create action files; returns the number of items."""
+        items = self.check_for_updates()
+        for item in items:
+            self.create_action_file(item)
+        return len(items)
+
+    def handle_event(self, event):
+        """Apply one item from the events queue (None is a plain wake-up)."""
+
+    def on_start(self):
+        """Called once before the first poll."""
+
+    def on_stop(self):
+        """Called once when the loop ends."""
+
+    def next_interval(self, current: float | None, found: int) -> float | None:
+        """Wait before the next poll, given how many items the last one found."""
+        if current is None:
+            return None
+        if found:
+            return max(self.min_interval, current * self.busy_shrink)
+        return min(self.max_interval, current * self.idle_growth)
+
+    def pending_delay(self) -> float | None:
+        """Seconds until already-known work falls due, or None. Caps the next wait."""
+        return None
+
+    def backoff_delay(self, errors: int) -> float:
+        """Jittered exponential wait after `errors` consecutive failed polls."""
+        delay = min(self.error_backoff_max, self.error_backoff_base * 2 ** (errors - 1))
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def wake(self):
+        """Poll now instead of waiting out the current interval."""
+        self.events.put(None)
+
+    def _wait(self, timeout: float | None):
+        """Block until an event arrives or the timeout passes, then drain the queue."""
+        try:
+            event = self.events.get(timeout=timeout)
+        except Empty:
+            return
+        while True:
+            self.handle_event(event)
+            try:
+                event = self.events.get_nowait()
+            except Empty:
+                return
+
     def run(self):
         """Main loop - continuously check for updates."""
         self.running = True
         print(f"[{self.__class__.__name__}] Starting watcher...")
+        self.on_start()
 
-        while self.running:
-            try:
-                items = self.check_for_updates()
-                for item in items:
-                    self.create_action_file(item)
-                time.sleep(1)
-            except KeyboardInterrupt:
-                print(f"\n[{self.__class__.__name__}] Stopping watcher...")
-                self.running = False
-                break
-            except Exception as e:
-                print(f"[{self.__class__.__name__}] Error: {e}")
-                time.sleep(5)
+        interval = self.interval
+        errors = 0
+        try:
+            while self.running:
+                try:
+                    found = self.poll_once()
+                    errors = 0
+                    interval = self.next_interval(interval, found)
+                    delay = interval
+                    due = self.pending_delay()
+                    if due is not None:
+                        delay = due if delay is None else min(delay, due)
+                except Exception as e:
+                    errors += 1
+                    delay = self.backoff_delay(errors)
+                    print(f"[{self.__class__.__name__}] Error: {e} (retrying in {delay:.0f}s)")
+
+                self._wait(delay)
+        except KeyboardInterrupt:
+            print(f"\n[{self.__class__.__name__}] Stopping watcher...")
+            self.running = False
+        finally:
+            self.on_stop()
 
     def stop(self):
         """Stop the watcher."""
         self.running = False
+        self.wake()
@@ -5,75 +5,406 @@ Monitors a drop folder and creates action files in /Needs_Action.
 """
 
 import argparse
+import fnmatch
 import os
+import re
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from queue import Queue
-from threading import Thread
 
 # Allow running from any directory (fixes ModuleNotFoundError for base_watcher)
 sys.path.insert(0, str(Path(__file__).parent))
+# ...and importing the shared vault helpers
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler, FileCreatedEvent
+from watchdog.events import (
+    FileClosedEvent,
+    FileCreatedEvent,
+    FileDeletedEvent,
+    FileModifiedEvent,
+    FileMovedEvent,
+    FileSystemEventHandler,
+)
 
 from base_watcher import BaseWatcher
+from common.file_hash import hash_file
+from common.file_manifest import FileManifest
+from common.priority import PRIORITY_EMOJI, get_classifier
+from common.processed_ids import ProcessedIdStore
+
+
+DEFAULT_SETTLE_SECONDS = 2.0
+DEFAULT_RESCAN_SECONDS = 300.0  # catches events lost to inotify queue overflow
+HASH_WORKERS = 2  # settled files hashed in parallel
+# Hidden and temporary files (and everything under hidden folders) are never actions
+DEFAULT_EXCLUDE = (".*", "~*")
+
+
+def _compile_globs(patterns) -> tuple[re.Pattern | None, re.Pattern | None]:
+    """
+    Compile glob patterns into (name regex, path regex).
+
+    Patterns without a "/" match a single name; patterns with one match the
+    path relative to the watch root. Either regex is None if it has no
+    patterns. Matching ignores case.
+    """
+    names = [fnmatch.translate(p) for p in patterns or () if "/" not in p]
+    paths = [fnmatch.translate(p.strip("/")) for p in patterns or () if "/" in p]
+    return (
+        re.compile("|".join(names), re.IGNORECASE) if names else None,
+        re.compile("|".join(paths), re.IGNORECASE) if paths else None,
+    )
+
+
+class PathFilter:
+    """
+    Include/exclude glob sets for dropped files, compiled once.
+
+    A file is accepted if its name or relative path matches an include
+    pattern (or there are none), and neither its relative path nor any name
+    along it matches an exclude pattern, so excluding "archive" skips the
+    whole archive/ subtree.
+    """
+
+    def __init__(self, include=None, exclude=DEFAULT_EXCLUDE):
+        self.include = list(include or ())
+        self.exclude = list(exclude or ())
+        self._include_name, self._include_path = _compile_globs(self.include)
+        self._exclude_name, self._exclude_path = _compile_globs(self.exclude)
+
+    def excludes(self, relative: str) -> bool:
+        """Whether a file or folder, given by its "/"-separated path under a root, is excluded."""
+        if self._exclude_name is not None and any(map(self._exclude_name.match, relative.split("/"))):
+            return True
+        return self._exclude_path is not None and bool(self._exclude_path.match(relative))
+
+    def matches(self, relative: str) -> bool:
+        """Whether a file, given by its "/"-separated path under a root, is accepted."""
+        if self.excludes(relative):
+            return False
+        parts = relative.split("/")
+        if not self.include:
+            return True
+        return bool(
+            (self._include_name is not None and self._include_name.match(parts[-1]))
+            or (self._include_path is not None and self._include_path.match(relative))
+        )
+
+
+def _signature(file_path: Path) -> tuple[int, int] | None:
+    """(size, mtime) of a file, or None if it is gone."""
+    try:
+        st = file_path.stat()
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+class PendingFiles:
+    """
+    Dropped files waiting for their writes to finish.
+
+    Every event for a path pushes its deadline settle_seconds out, so a burst
+    of events becomes one entry. At the deadline the file is emitted only if
+    its size and mtime match what was recorded at the last event; otherwise
+    the new values are recorded and the file waits another window.
+
+    Only the watcher's dispatcher thread touches it, so it needs no lock.
+    """
+
+    def __init__(self, settle_seconds: float = DEFAULT_SETTLE_SECONDS):
+        self.settle_seconds = settle_seconds
+        self._entries: dict[Path, list] = {}  # path -> [deadline, signature]
+
+    def touch(self, file_path: Path, signature: tuple[int, int] | None = None):
+        """Record activity on a path and restart its settle window."""
+        self._entries[file_path] = [time.monotonic() + self.settle_seconds, signature]
+
+    def __contains__(self, file_path: Path) -> bool:
+        return file_path in self._entries
+
+    def discard(self, file_path: Path):
+        self._entries.pop(file_path, None)
+
+    def ready(self) -> list[Path]:
+        """Remove and return the paths whose size and mtime have settled."""
+        now = time.monotonic()
+        settled = []
+        for path, entry in list(self._entries.items()):
+            if entry[0] > now:
+                continue
+            current = _signature(path)
+            if current is None:
+                del self._entries[path]
+            elif current == entry[1]:
+                del self._entries[path]
+                settled.append(path)
+            else:
+                entry[:] = [now + self.settle_seconds, current]
+        return settled
+
+    def next_due(self) -> float | None:
+        """Seconds until the earliest deadline, or None if nothing is pending."""
+        if not self._entries:
+            return None
+        deadline = min(deadline for deadline, _ in self._entries.values())
+        return max(0.0, deadline - time.monotonic())
 
 
 class FileDropHandler(FileSystemEventHandler):
-    """Handle file system events for dropped files."""
+    """
+    Forward file system events to the watcher's event queue.
 
-    def __init__(self, queue: Queue):
-        self.queue = queue
+    Runs on the observer thread, so it only enqueues (kind, path, dest)
+    tuples; stat calls and bookkeeping happen in the dispatcher.
+    """
+
+    def __init__(self, events: Queue):
+        self.events = events
 
     def on_created(self, event: FileCreatedEvent):
-        if event.is_directory:
-            return
+        if not event.is_directory:
+            self.events.put(("created", Path(event.src_path), None))
 
-        file_path = Path(event.src_path)
+    def on_modified(self, event: FileModifiedEvent):
+        if not event.is_directory:
+            self.events.put(("modified", Path(event.src_path), None))
 
-        # Ignore hidden files (starting with . or ~)
-        if file_path.name.startswith('.') or file_path.name.startswith('~'):
-            return
+    def on_closed(self, event: FileClosedEvent):
+        if not event.is_directory:
+            self.events.put(("closed", Path(event.src_path), None))
+
+    def on_moved(self, event: FileMovedEvent):
+        if not event.is_directory:
+            self.events.put(("moved", Path(event.src_path), Path(event.dest_path)))
 
-        self.queue.put(file_path)
+    def on_deleted(self, event: FileDeletedEvent):
+        if not event.is_directory:
+            self.events.put(("deleted", Path(event.src_path), None))
 
 
 class FileSystemWatcher(BaseWatcher):
-    """Watch a directory for new files and create action items."""
+    """Watch one or more directories for new files and create action items."""
 
     def __init__(
         self,
         watch_path: str | None = None,
         vault_path: str | None = None,
         dry_run: bool = False,
+        settle_seconds: float = DEFAULT_SETTLE_SECONDS,
+        watch_paths: list[str] | None = None,
+        recursive: bool = False,
+        include: list[str] | None = None,
+        exclude: list[str] | None = None,
+        rescan_seconds: float = DEFAULT_RESCAN_SECONDS,
     ):
-        super().__init__(dry_run=dry_run)
+        # Event-driven: the loop sleeps until a drop, a settle deadline or a rescan
+        super().__init__(dry_run=dry_run, interval=rescan_seconds or None)
+        self.rescan_seconds = rescan_seconds
+        self._next_rescan = 0.0
 
         # Set up paths
-        self.watch_path = Path(watch_path or os.path.expanduser("~/AI_Drop"))
-        self.vault_path = Path(vault_path or Path(__file__).parent.parent)
+        roots = watch_paths or [watch_path or os.path.expanduser("~/AI_Drop")]
+        self.watch_paths = [Path(p).expanduser().absolute() for p in roots]
+        self.watch_path = self.watch_paths[0]
+        self.recursive = recursive
+        self.vault_path = Path(vault_path or Path(__file__).parent.parent).absolute()
         self.needs_action_path = self.vault_path / "Needs_Action"
+        self.handbook_path = self.vault_path / "Company_Handbook.md"
+        self.manifest_file = self.vault_path / "memory" / "filesystem_manifest.sqlite3"
+        self.hash_index_file = self.vault_path / "memory" / "filesystem_hashes.sqlite3"
 
         # Create directories if they don't exist
-        self.watch_path.mkdir(parents=True, exist_ok=True)
+        for root in self.watch_paths:
+            root.mkdir(parents=True, exist_ok=True)
         self.needs_action_path.mkdir(parents=True, exist_ok=True)
 
-        # Queue for file events
-        self.file_queue: Queue[Path] = Queue()
+        # Which files count as drops
+        self.filter = PathFilter(include, list(DEFAULT_EXCLUDE) + list(exclude or ()))
+
+        # Files seen by the observer, held until fully written
+        self.pending = PendingFiles(settle_seconds)
+
+        # Files already picked up, so restarts and rescans only report new ones
+        self.manifest = FileManifest(self.manifest_file, readonly=dry_run)
+
+        # Content digests of files that got an action, so re-drops are skipped.
+        # Settled files are hashed on worker threads, never the dispatcher.
+        self.hash_index = ProcessedIdStore(self.hash_index_file)
+        self.hasher = ThreadPoolExecutor(max_workers=HASH_WORKERS, thread_name_prefix="hash")
+        self._hashing: set[Path] = set()
+        self._hashed: list[Path] = []
+        self._digests: dict[Path, str] = {}
 
         # Set up watchdog observer
-        self.event_handler = FileDropHandler(self.file_queue)
+        self.event_handler = FileDropHandler(self.events)
         self.observer = Observer()
 
+    def _relative(self, file_path: Path) -> str | None:
+        """A file's path under its (innermost) watch root, or None if outside them all."""
+        best = None
+        for root in self.watch_paths:
+            if file_path.is_relative_to(root):
+                relative = file_path.relative_to(root)
+                if best is None or len(relative.parts) < len(best.parts):
+                    best = relative
+        if best is None or (not self.recursive and len(best.parts) != 1):
+            return None
+        return best.as_posix()
+
+    def _accepts(self, file_path: Path) -> bool:
+        if file_path.is_relative_to(self.needs_action_path):
+            return False  # our own output, if a recursive root contains the vault
+        relative = self._relative(file_path)
+        return relative is not None and self.filter.matches(relative)
+
+    def handle_event(self, event):
+        """Apply a queued file system event to the pending files."""
+        if event is None:
+            return
+        kind, file_path, dest_path = event
+        if kind == "hashed":
+            self._finish_hash(file_path, dest_path)
+            return
+        if kind == "moved":
+            # Write-then-rename (editors, downloads): track the final name only
+            self.pending.discard(file_path)
+            self.manifest.forget(file_path)
+            kind, file_path = "created", dest_path
+        if kind == "deleted":
+            self.pending.discard(file_path)
+            self.manifest.forget(file_path)
+        elif kind == "created" or file_path in self.pending:
+            # Later edits to files already picked up are not new drops
+            if kind != "created" or self._accepts(file_path):
+                self.pending.touch(file_path, _signature(file_path))
+
+    def _skips_dir(self, dir_path: str) -> bool:
+        """Whether a scan should not descend into a folder."""
+        path = Path(dir_path)
+        if path == self.needs_action_path or not self.recursive:
+            return True
+        relative = self._relative(path / "_")
+        return relative is None or self.filter.excludes(relative.rsplit("/", 1)[0])
+
+    def scan(self, baseline: bool = False) -> int:
+        """
+        Reconcile the watched folders with the manifest.
+
+        Files not in the manifest are queued like fresh drops (or, with
+        baseline, just recorded). Folders whose mtime has not changed since
+        their last listing are not listed again, and a listed file whose
+        inode matches the manifest is skipped without a stat call, so the
+        work done is proportional to what changed. Returns the number of
+        files found.
+        """
+        found = 0
+        stack = [str(root) for root in self.watch_paths]
+        while stack:
+            dir_path = stack.pop()
+            try:
+                st = os.stat(dir_path)
+            except OSError:
+                self.manifest.forget_dir(dir_path)
+                continue
+            if self.manifest.dir_unchanged(dir_path, st.st_mtime_ns):
+                if self.recursive:
+                    stack.extend(self.manifest.subdirs(dir_path))
+                continue
+
+            # Files found here but not yet in the manifest keep the folder's
+            # mtime from being trusted, so a restart lists it again
+            names, subdirs, unsettled = set(), set(), False
+            try:
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not self._skips_dir(entry.path):
+                                subdirs.add(entry.path)
+                            continue
+                        if not entry.is_file(follow_symlinks=False):
+                            continue
+                        names.add(entry.name)
+                        if self.manifest.seen(dir_path, entry.name, entry.inode()):
+                            continue
+                        file_path = Path(entry.path)
+                        if self._in_flight(file_path):
+                            unsettled = True
+                            continue
+                        if not self._accepts(file_path):
+                            continue
+                        if baseline:
+                            self.manifest.record(file_path)
+                        else:
+                            self.pending.touch(file_path, _signature(file_path))
+                            unsettled = True
+                        found += 1
+            except OSError:
+                continue
+
+            for name in self.manifest.names(dir_path) - names:
+                self.manifest.forget(Path(dir_path) / name)
+            for gone in set(self.manifest.subdirs(dir_path)) - subdirs:
+                self.manifest.forget_dir(gone)
+            self.manifest.record_dir(dir_path, None if unsettled else st.st_mtime_ns)
+            stack.extend(subdirs)
+
+        self.manifest.flush()
+        return found
+
+    def _in_flight(self, file_path: Path) -> bool:
+        """Whether a file was seen but has not reached the manifest yet."""
+        return file_path in self.pending or file_path in self._hashing or file_path in self._hashed
+
+    def _start_hash(self, file_path: Path):
+        """Hash a settled file on a worker; the result comes back as a "hashed" event."""
+        self._hashing.add(file_path)
+        future = self.hasher.submit(hash_file, file_path)
+        future.add_done_callback(lambda f: self.events.put(("hashed", file_path, f)))
+
+    def _finish_hash(self, file_path: Path, future):
+        self._hashing.discard(file_path)
+        if future.cancelled():
+            return
+        try:
+            digest, _ = future.result()
+        except FileNotFoundError:
+            return  # deleted after settling
+        except OSError as e:
+            print(f"[FileSystemWatcher] Could not hash {file_path.name}: {e}")
+            digest = None
+        if digest is not None:
+            self._digests[file_path] = digest
+        self._hashed.append(file_path)
+
     def check_for_updates(self) -> list:
-        """Check queue for new files."""
-        items = []
-        while not self.file_queue.empty():
-            items.append(self.file_queue.get())
-        return items
+        """Return dropped files that have finished being written and hashed."""
+        if self.rescan_seconds and time.monotonic() >= self._next_rescan:
+            self._next_rescan = time.monotonic() + self.rescan_seconds
+            found = self.scan()
+            if found:
+                print(f"[FileSystemWatcher] Rescan found {found} missed file(s)")
+        for file_path in self.pending.ready():
+            self._start_hash(file_path)
+        hashed, self._hashed = self._hashed, []
+        return hashed
+
+    def poll_once(self) -> int:
+        """Create action files for settled drops and save the manifest."""
+        found = super().poll_once()
+        if found:
+            self.manifest.flush()
+            if not self.dry_run:
+                self.hash_index.flush()
+        return found
+
+    def pending_delay(self) -> float | None:
+        """Wake when the next dropped file is due to have settled."""
+        return self.pending.next_due()
 
     def _get_file_type(self, file_path: Path) -> str:
         """Determine file type from extension."""
@@ -138,6 +469,12 @@ class FileSystemWatcher(BaseWatcher):
             'Process accordingly',
         ])
 
+    def _classify_priority(self, file_path: Path) -> str:
+        """Classify a dropped file by the handbook's Priority Keywords in its name."""
+        # "URGENT_invoice.pdf" -> "URGENT invoice pdf" so each part is a word
+        name = re.sub(r"[_.]+", " ", file_path.name)
+        return get_classifier(self.handbook_path).classify(name)
+
     def _format_size(self, size_bytes: int) -> str:
         """Format file size in human-readable form."""
         for unit in ['B', 'KB', 'MB', 'GB']:
@@ -146,8 +483,19 @@ class FileSystemWatcher(BaseWatcher):
             size_bytes /= 1024
         return f"{size_bytes:.1f} TB"
 
-    def create_action_file(self, item: Path) -> Path:
-        """Create an action file in /Needs_Action for a dropped file."""
+    def create_action_file(self, item: Path) -> Path | None:
+        """
+        Create an action file in /Needs_Action for a dropped file.
+
+        Returns None without writing anything if a file with the same content
+        already got an action.
+        """
+        digest = self._digests.pop(item, None)
+        if digest is not None and digest in self.hash_index:
+            print(f"[FileSystemWatcher] Skipped duplicate: {item.name} (sha256 {digest[:12]})")
+            self.manifest.record(item)
+            return None
+
         now = datetime.now()
         timestamp = now.strftime("%Y%m%d_%H%M%S")
         readable_time = now.strftime("%Y-%m-%d %H:%M:%S")
@@ -160,9 +508,12 @@ class FileSystemWatcher(BaseWatcher):
 
         file_type = self._get_file_type(item)
         suggested_actions = self._get_suggested_actions(file_type)
+        priority = self._classify_priority(item)
 
-        # Create action file name
-        safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in item.stem)
+        # Create action file name; files in subfolders keep the folder in the
+        # name so same-named drops from different clients do not collide
+        stem = Path(self._relative(item) or item.name).with_suffix("").as_posix()
+        safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in stem)
         action_filename = f"FILE_{safe_name}_{timestamp}.md"
         action_path = self.needs_action_path / action_filename
 
@@ -173,6 +524,8 @@ original_name: {item.name}
 original_path: {item}
 size: {file_size}
 detected: {readable_time}
+priority: {PRIORITY_EMOJI[priority]} {priority}
+sha256: {digest or ''}
 status: pending
 ---
 
@@ -184,6 +537,7 @@ status: pending
 - **Type:** {file_type}
 - **Size:** {self._format_size(file_size)}
 - **Detected:** {readable_time}
+- **Priority:** {PRIORITY_EMOJI[priority]} {priority}
 - **Location:** {item}
 
 ## Suggested Actions
@@ -207,37 +561,55 @@ _Add any notes about this file here._
         else:
             action_path.write_text(content, encoding="utf-8")
             print(f"[FileSystemWatcher] Created: {action_path.name}")
+            if digest is not None:
+                self.hash_index.add(digest)
+        self.manifest.record(item)
 
         return action_path
 
-    def run(self):
+    def on_start(self):
         """Start watching for file drops."""
-        print(f"[FileSystemWatcher] Watching: {self.watch_path}")
+        for root in self.watch_paths:
+            print(f"[FileSystemWatcher] Watching: {root}{' (recursive)' if self.recursive else ''}")
+        if self.filter.include:
+            print(f"[FileSystemWatcher] Including: {', '.join(self.filter.include)}")
+        print(f"[FileSystemWatcher] Excluding: {', '.join(self.filter.exclude)}")
         print(f"[FileSystemWatcher] Actions go to: {self.needs_action_path}")
+        print(f"[FileSystemWatcher] Files are picked up once unchanged for {self.pending.settle_seconds}s")
         if self.dry_run:
             print("[FileSystemWatcher] DRY RUN MODE - No files will be created")
         print("[FileSystemWatcher] Press Ctrl+C to stop\n")
 
-        self.observer.schedule(self.event_handler, str(self.watch_path), recursive=False)
+        # One observer (and inotify instance) serves every root
+        for root in self.watch_paths:
+            self.observer.schedule(self.event_handler, str(root), recursive=self.recursive)
         self.observer.start()
-        self.running = True
 
-        try:
-            while self.running:
-                items = self.check_for_updates()
-                for item in items:
-                    self.create_action_file(item)
-                time.sleep(1)
-        except KeyboardInterrupt:
-            print("\n[FileSystemWatcher] Stopping...")
-        finally:
-            self.observer.stop()
-            self.observer.join()
-            print("[FileSystemWatcher] Stopped.")
+        # Pick up anything dropped while we were stopped. With no manifest yet
+        # there is no telling what is new, so existing files are only recorded.
+        if self.manifest.empty:
+            count = self.scan(baseline=True)
+            print(f"[FileSystemWatcher] First run: recorded {count} existing file(s)")
+        else:
+            count = self.scan()
+            print(f"[FileSystemWatcher] Found {count} file(s) dropped while stopped")
+        self._next_rescan = time.monotonic() + (self.rescan_seconds or 0)
+
+    def on_stop(self):
+        """Stop the observer."""
+        self.observer.stop()
+        self.observer.join()
+        # Files still settling or being hashed are not in the manifest. Their
+        # folders either changed since the last scan or were saved without an
+        # mtime (see scan), so the next start lists them and picks the files up.
+        self.hasher.shutdown(wait=True, cancel_futures=True)
+        self.manifest.close()
+        self.hash_index.close()
+        print("[FileSystemWatcher] Stopped.")
 
     def stop(self):
         """Stop the watcher."""
-        self.running = False
+        super().stop()
         self.observer.stop()
 
 
@@ -247,9 +619,29 @@ def main():
     )
     parser.add_argument(
         "--watch-path",
-        type=str,
+        dest="watch_paths",
+        action="append",
+        default=None,
+        help="Directory to watch; repeat for several (default: ~/AI_Drop)",
+    )
+    parser.add_argument(
+        "--recursive",
+        action="store_true",
+        help="Also watch subfolders of each watch path",
+    )
+    parser.add_argument(
+        "--include",
+        action="append",
         default=None,
-        help="Directory to watch (default: ~/AI_Drop)",
+        metavar="GLOB",
+        help="Only pick up files matching this glob, e.g. '*.pdf' or 'acme/*'; repeatable",
+    )
+    parser.add_argument(
+        "--exclude",
+        action="append",
+        default=None,
+        metavar="GLOB",
+        help="Skip files (or folders) matching this glob, in addition to hidden and ~ files; repeatable",
     )
     parser.add_argument(
         "--vault-path",
@@ -263,12 +655,33 @@ def main():
         help="Log actions without creating files",
     )
 
+    parser.add_argument(
+        "--settle",
+        type=float,
+        default=DEFAULT_SETTLE_SECONDS,
+        help=f"Seconds a file's size and mtime must stay unchanged before it is picked up "
+             f"(default: {DEFAULT_SETTLE_SECONDS})",
+    )
+
+    parser.add_argument(
+        "--rescan",
+        type=float,
+        default=DEFAULT_RESCAN_SECONDS,
+        help=f"Seconds between rescans for files whose events were missed, 0 to disable "
+             f"(default: {DEFAULT_RESCAN_SECONDS:.0f})",
+    )
+
     args = parser.parse_args()
 
     watcher = FileSystemWatcher(
-        watch_path=args.watch_path,
         vault_path=args.vault_path,
         dry_run=args.dry_run,
+        settle_seconds=args.settle,
+        watch_paths=args.watch_paths,
+        recursive=args.recursive,
+        include=args.include,
+        exclude=args.exclude,
+        rescan_seconds=args.rescan,
     )
     watcher.run()
 
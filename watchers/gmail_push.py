@@ -0,0 +1,188 @@
+"""Gmail Push - Receives Gmail watch notifications delivered by Pub/Sub push.
+
+Gmail's users.watch() publishes a message to a Pub/Sub topic whenever the
+mailbox changes; a push subscription POSTs it to an HTTP endpoint as
+
+    {"message": {"data": base64({"emailAddress": ..., "historyId": ...}),
+                 "messageId": ..., "publishTime": ...},
+     "subscription": ...}
+
+PushReceiver serves that endpoint locally and hands each notification to a
+callback. Running this file as a script is a stand-in publisher that posts
+the same envelope, for testing without Google Cloud.
+"""
+
+import argparse
+import base64
+import hmac
+import json
+import threading
+import urllib.request
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable
+from urllib.parse import parse_qs, quote, urlparse
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8085
+DEFAULT_PATH = "/gmail/push"
+MAX_BODY_BYTES = 64 * 1024  # notifications are a few hundred bytes
+
+
+def parse_notification(body: bytes) -> tuple[str, str]:
+    """
+    Decode a Pub/Sub push envelope into (email_address, history_id).
+
+    Raises ValueError if the payload is not a Gmail notification or its
+    historyId is not a positive integer.
+    """
+    try:
+        envelope = json.loads(body)
+        data = base64.b64decode(envelope["message"]["data"])
+        payload = json.loads(data)
+        history_id = int(payload["historyId"])
+        if history_id <= 0 or isinstance(payload["historyId"], (bool, float)):
+            raise ValueError(f"invalid historyId {payload['historyId']!r}")
+        return str(payload["emailAddress"]), str(history_id)
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"not a Gmail push notification: {e}") from e
+
+
+def build_envelope(email_address: str, history_id: str) -> dict:
+    """Build a Pub/Sub push envelope the way Gmail's watch delivers it."""
+    data = json.dumps({"emailAddress": email_address, "historyId": int(history_id)})
+    return {
+        "message": {
+            "data": base64.b64encode(data.encode()).decode(),
+            "messageId": uuid.uuid4().hex,
+            "publishTime": datetime.now(timezone.utc).isoformat(),
+        },
+        "subscription": "projects/local/subscriptions/gmail-push",
+    }
+
+
+class PushReceiver:
+    """Local HTTP endpoint for Gmail push notifications."""
+
+    def __init__(
+        self,
+        on_notification: Callable[[str, str], None],
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        path: str = DEFAULT_PATH,
+        token: str | None = None,
+    ):
+        self.on_notification = on_notification
+        self.path = path
+        self.token = token
+        self.server = ThreadingHTTPServer((host, port), self._handler_class())
+        self.server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}{self.path}"
+
+    def _handler_class(self):
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                url = urlparse(self.path)
+                if url.path != receiver.path:
+                    self.send_error(404)
+                    return
+
+                # Pub/Sub push endpoints are authenticated with a shared ?token=
+                if receiver.token is not None:
+                    supplied = parse_qs(url.query).get("token", [""])[0]
+                    if not hmac.compare_digest(supplied, receiver.token):
+                        self.send_error(403)
+                        return
+
+                length = int(self.headers.get("Content-Length") or 0)
+                if length > MAX_BODY_BYTES:
+                    self.send_error(413)
+                    return
+
+                try:
+                    email_address, history_id = parse_notification(self.rfile.read(length))
+                except ValueError as e:
+                    # Acknowledge so Pub/Sub does not redeliver a payload we can never use
+                    print(f"[GmailPush] Ignoring notification: {e}")
+                    self.send_response(204)
+                    self.end_headers()
+                    return
+
+                receiver.on_notification(email_address, history_id)
+                self.send_response(204)
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        """Serve notifications on a background thread."""
+        self._thread = threading.Thread(
+            target=self.server.serve_forever, name="gmail-push", daemon=True
+        )
+        self._thread.start()
+        print(f"[GmailPush] Listening on {self.url}")
+
+    def stop(self):
+        """Stop serving and close the socket."""
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def publish(url: str, email_address: str, history_id: str, token: str | None = None) -> int:
+    """POST a Gmail-style notification to a push endpoint; returns the HTTP status."""
+    if token:
+        url = f"{url}{'&' if '?' in url else '?'}token={quote(token, safe='')}"
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(build_envelope(email_address, history_id)).encode(),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    with urllib.request.urlopen(request, timeout=10) as response:
+        return response.status
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Gmail Push - Send a fake Gmail watch notification to a local receiver"
+    )
+    parser.add_argument(
+        "--url",
+        default=f"http://{DEFAULT_HOST}:{DEFAULT_PORT}{DEFAULT_PATH}",
+        help="Push endpoint (default: the gmail_watcher.py --push-port receiver)",
+    )
+    parser.add_argument(
+        "--email",
+        default="me@example.com",
+        help="Mailbox address to report",
+    )
+    parser.add_argument(
+        "--history-id",
+        required=True,
+        help="historyId to report (must be newer than the watcher's to trigger a fetch)",
+    )
+    parser.add_argument(
+        "--token",
+        default=None,
+        help="Shared token expected by the receiver",
+    )
+
+    args = parser.parse_args()
+
+    status = publish(args.url, args.email, args.history_id, args.token)
+    print(f"[GmailPush] Published historyId {args.history_id} to {args.url}: HTTP {status}")
+
+
+if __name__ == "__main__":
+    main()
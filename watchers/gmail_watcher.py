@@ -1,57 +1,104 @@
 """Gmail Watcher - Monitors Gmail for unread important emails."""
 
 import argparse
-import base64
 import json
+import os
 import re
+import sys
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 
 from base_watcher import BaseWatcher
+from gmail_push import DEFAULT_HOST, PushReceiver
+
+# Allow importing the shared vault helpers when run as a script
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from common.gmail_client import (
+    BATCH_LIMIT,
+    DOWNLOAD_CHUNK,
+    execute_with_backoff,
+    get_client,
+    is_retryable,
+)
+from common.gmail_mime import AttachmentTooLarge, extract_body, list_attachments, stream_base64
+from common.priority import PRIORITY_EMOJI, get_classifier
+from common.processed_ids import ProcessedIdStore
 
 # Gmail API scopes
 SCOPES = ["https://www.googleapis.com/auth/gmail.readonly"]
 
-# Priority classification keywords
-PRIORITY_KEYWORDS = {
-    "critical": ["urgent", "emergency", "asap", "immediately"],
-    "high": ["important", "deadline", "payment", "invoice"],
-    "medium": ["question", "update", "follow-up", "meeting"],
-}
+# Which emails become action items
+GMAIL_QUERY = "is:unread is:important"
+REQUIRED_LABELS = {"UNREAD", "IMPORTANT"}
 
-# Priority emoji mapping
-PRIORITY_EMOJI = {
-    "critical": "🔴",
-    "high": "🟠",
-    "medium": "🟡",
-    "low": "🟢",
-}
+BODY_LIMIT = 3000  # characters of email body kept in the action file
+ATTACHMENT_MAX_MB = 25  # Gmail's own limit for received attachments
+
+# Backfill settings
+BACKFILL_PAGE_SIZE = 500  # messages.list maximum
+BACKFILL_CONCURRENCY = 4  # batch requests in flight at once
+BACKFILL_RETRIES = 5  # attempts per rate-limited request
+
+# Gmail watch registrations expire after 7 days; Google recommends renewing daily
+WATCH_RENEW_INTERVAL = 24 * 3600
 
 
 class GmailWatcher(BaseWatcher):
     """Watches Gmail for unread important emails and creates action files."""
 
+    error_backoff_base = 30.0  # Gmail errors are usually quota; start slow
+    error_backoff_max = 900.0
+
     def __init__(
         self,
         vault_path: Path,
         credentials_path: Path,
         dry_run: bool = False,
         check_interval: int = 120,
+        min_interval: float | None = None,
+        max_interval: float | None = None,
+        incremental: bool = False,
+        push_port: int | None = None,
+        push_host: str = DEFAULT_HOST,
+        push_token: str | None = None,
+        watch_topic: str | None = None,
+        attachments_dir: Path | None = None,
+        attachment_max_mb: int = ATTACHMENT_MAX_MB,
     ):
-        super().__init__(dry_run=dry_run)
+        # Poll faster while mail is arriving, slower when the mailbox is quiet
+        super().__init__(
+            dry_run=dry_run,
+            interval=check_interval,
+            min_interval=min_interval if min_interval is not None else check_interval / 4,
+            max_interval=max_interval if max_interval is not None else check_interval * 3,
+        )
         self.vault_path = Path(vault_path)
         self.credentials_path = Path(credentials_path)
         self.check_interval = check_interval
+        # Push notifications only say "something changed"; the History API says what
+        self.incremental = incremental or push_port is not None
+        self.push_port = push_port
+        self.push_host = push_host
+        self.push_token = push_token
+        self.watch_topic = watch_topic
+        # Opt-in: where to save attachments (point at the file watcher's drop folder)
+        self.attachments_dir = Path(attachments_dir) if attachments_dir else None
+        self.attachment_max_bytes = attachment_max_mb * 1024 * 1024
         self.needs_action_path = self.vault_path / "Needs_Action"
         self.memory_path = self.vault_path / "memory"
-        self.processed_ids_file = self.memory_path / "gmail_processed_ids.json"
+        self.processed_ids_file = self.memory_path / "gmail_processed_ids.sqlite3"
+        self.legacy_processed_ids_file = self.memory_path / "gmail_processed_ids.json"
+        self.sync_state_file = self.memory_path / "gmail_sync_state.json"
+        self.backfill_file = self.memory_path / "gmail_backfill.json"
+        self.attachment_index_file = self.memory_path / "gmail_attachments.sqlite3"
         self.token_path = self.vault_path / "config" / "token.json"
+        self.handbook_path = self.vault_path / "Company_Handbook.md"
 
         # Ensure directories exist
         self.needs_action_path.mkdir(parents=True, exist_ok=True)
@@ -60,94 +107,118 @@ class GmailWatcher(BaseWatcher):
         # Load processed IDs
         self.processed_ids = self._load_processed_ids()
 
+        # Content hash -> saved path, so each attachment is stored once
+        self.attachment_index = (
+            ProcessedIdStore(self.attachment_index_file) if self.attachments_dir else None
+        )
+
+        # Mailbox historyId we have synced up to (incremental mode)
+        self.history_id = self._load_history_id()
+        self._next_history_id = None
+
         # Initialize Gmail service
+        self.client = get_client(
+            self.token_path,
+            self.credentials_path,
+            scopes=SCOPES,
+            interactive=True,
+        )
         self.service = None
 
-    def _load_processed_ids(self) -> set:
-        """Load previously processed email IDs from disk."""
-        if self.processed_ids_file.exists():
-            try:
-                with open(self.processed_ids_file, "r") as f:
-                    data = json.load(f)
-                    return set(data.get("processed_ids", []))
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"[GmailWatcher] Warning: Could not load processed IDs: {e}")
-        return set()
+        self._watch_renew_at = 0.0
+        self._receiver = None
+
+    def _load_processed_ids(self) -> ProcessedIdStore:
+        """Open the processed email ID store, importing the old JSON list once."""
+        store = ProcessedIdStore(self.processed_ids_file)
+        migrated = store.import_json(self.legacy_processed_ids_file)
+        if migrated:
+            print(f"[GmailWatcher] Migrated {migrated} processed IDs to {self.processed_ids_file.name}")
+        return store
 
     def _save_processed_ids(self):
-        """Save processed email IDs to disk."""
+        """Persist email IDs processed since the last save (once per cycle)."""
         try:
-            with open(self.processed_ids_file, "w") as f:
+            self.processed_ids.flush()
+        except Exception as e:
+            print(f"[GmailWatcher] Warning: Could not save processed IDs: {e}")
+
+    def _save_attachment_index(self):
+        """Persist attachments saved since the last save (once per cycle)."""
+        if self.attachment_index is None:
+            return
+        try:
+            self.attachment_index.flush()
+        except Exception as e:
+            print(f"[GmailWatcher] Warning: Could not save attachment index: {e}")
+
+    def _load_history_id(self) -> str | None:
+        """Load the last synced mailbox historyId from disk."""
+        if self.sync_state_file.exists():
+            try:
+                with open(self.sync_state_file, "r") as f:
+                    return json.load(f).get("history_id")
+            except (json.JSONDecodeError, IOError) as e:
+                print(f"[GmailWatcher] Warning: Could not load sync state: {e}")
+        return None
+
+    def _save_history_id(self):
+        """Persist the historyId reached by the last check, once its emails are handled."""
+        if self._next_history_id is None or self._next_history_id == self.history_id:
+            return
+        self.history_id = self._next_history_id
+        if self.dry_run:
+            return
+        try:
+            with open(self.sync_state_file, "w") as f:
                 json.dump(
                     {
-                        "processed_ids": list(self.processed_ids),
+                        "history_id": self.history_id,
                         "last_updated": datetime.now().isoformat(),
                     },
                     f,
                     indent=2,
                 )
         except IOError as e:
-            print(f"[GmailWatcher] Warning: Could not save processed IDs: {e}")
-
-    def _authenticate(self) -> Credentials:
-        """Authenticate with Gmail API using OAuth 2.0."""
-        creds = None
-
-        # Check for existing token
-        if self.token_path.exists():
-            try:
-                creds = Credentials.from_authorized_user_file(str(self.token_path), SCOPES)
-            except Exception as e:
-                print(f"[GmailWatcher] Could not load token: {e}")
-
-        # Refresh or get new credentials
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                print("[GmailWatcher] Refreshing expired token...")
-                try:
-                    creds.refresh(Request())
-                except Exception as e:
-                    print(f"[GmailWatcher] Token refresh failed: {e}")
-                    creds = None
-
-            if not creds:
-                if not self.credentials_path.exists():
-                    raise FileNotFoundError(
-                        f"Credentials file not found: {self.credentials_path}\n"
-                        "Run /gmail-setup skill for setup instructions."
-                    )
-
-                print("[GmailWatcher] Starting OAuth flow...")
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    str(self.credentials_path), SCOPES
-                )
-                creds = flow.run_local_server(port=0)
-
-            # Save token for future runs
-            self.token_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.token_path, "w") as token:
-                token.write(creds.to_json())
-            print(f"[GmailWatcher] Token saved to {self.token_path}")
-
-        return creds
+            print(f"[GmailWatcher] Warning: Could not save sync state: {e}")
 
     def _init_service(self):
-        """Initialize the Gmail API service."""
-        if self.service is None:
-            creds = self._authenticate()
-            self.service = build("gmail", "v1", credentials=creds)
+        """Get the Gmail API service, refreshing the token if it expired."""
+        first = self.service is None
+        self.service = self.client.service()
+        if first:
             print("[GmailWatcher] Gmail API service initialized")
 
-    def _classify_priority(self, subject: str, body: str) -> str:
-        """Classify email priority based on keywords."""
-        text = f"{subject} {body}".lower()
+    def notify(self, email_address: str, history_id: str):
+        """Handle a push notification: check now unless we are already past it."""
+        if self.history_id is not None and int(history_id) <= int(self.history_id):
+            return
+        print(f"[GmailWatcher] Push notification for {email_address} (historyId {history_id})")
+        self.wake()
 
-        for priority, keywords in PRIORITY_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword in text:
-                    return priority
+    def _register_watch(self):
+        """Ask Gmail to publish mailbox changes to the Pub/Sub topic."""
+        self._init_service()
+        response = execute_with_backoff(
+            self.service.users().watch(
+                userId="me",
+                body={
+                    "topicName": self.watch_topic,
+                    "labelIds": ["IMPORTANT"],
+                    "labelFilterBehavior": "INCLUDE",
+                },
+            )
+        )
+        expires = int(response["expiration"]) / 1000
+        self._watch_renew_at = min(time.time() + WATCH_RENEW_INTERVAL, expires - 3600)
+        print(
+            f"[GmailWatcher] Gmail watch registered on {self.watch_topic} "
+            f"(expires {datetime.fromtimestamp(expires).strftime('%Y-%m-%d %H:%M')})"
+        )
 
-        return "low"
+    def _classify_priority(self, subject: str, body: str) -> str:
+        """Classify email priority using the handbook's Priority Keywords."""
+        return get_classifier(self.handbook_path).classify(body, subject=subject)
 
     def _parse_email(self, message: dict) -> dict:
         """Parse Gmail message into structured data."""
@@ -163,34 +234,14 @@ class GmailWatcher(BaseWatcher):
         # Extract date
         date_str = header_dict.get("date", "")
 
-        # Extract body/snippet
-        body = message.get("snippet", "")
-
-        # Try to get full body text
-        payload = message.get("payload", {})
-        parts = payload.get("parts", [])
-
-        if parts:
-            for part in parts:
-                if part.get("mimeType") == "text/plain":
-                    data = part.get("body", {}).get("data", "")
-                    if data:
-                        try:
-                            body = base64.urlsafe_b64decode(data).decode("utf-8")
-                        except Exception:
-                            pass
-                        break
-        elif payload.get("body", {}).get("data"):
-            try:
-                body = base64.urlsafe_b64decode(
-                    payload["body"]["data"]
-                ).decode("utf-8")
-            except Exception:
-                pass
-
-        # Truncate long bodies
-        if len(body) > 3000:
-            body = body[:3000] + "\n\n... [truncated]"
+        # Extract body text (decoding stops at the limit), else the snippet
+        extracted = extract_body(message.get("payload", {}), BODY_LIMIT)
+        if extracted is None or not extracted[0].strip():
+            body = message.get("snippet", "")
+        else:
+            body, truncated = extracted
+            if truncated:
+                body += "\n\n... [truncated]"
 
         # Clean up body text
         body = body.strip()
@@ -201,58 +252,309 @@ class GmailWatcher(BaseWatcher):
             "subject": subject,
             "date": date_str,
             "body": body,
+            "attachments": list_attachments(message.get("payload", {})),
         }
 
+    def _list_query(self) -> list[str]:
+        """List message IDs matching the watch query."""
+        results = self.service.users().messages().list(
+            userId="me",
+            q=GMAIL_QUERY,
+            maxResults=20,
+        ).execute()
+        return [msg_ref["id"] for msg_ref in results.get("messages", [])]
+
+    def _full_resync(self) -> list[str]:
+        """Run the full query and restart incremental sync from the current mailbox state."""
+        # Take the historyId first so nothing arriving during the list is missed
+        profile = self.service.users().getProfile(userId="me").execute()
+        self._next_history_id = profile["historyId"]
+        return self._list_query()
+
+    def _list_history(self) -> list[str]:
+        """
+        List IDs of messages added or labelled since the last synced historyId.
+
+        Falls back to a full resync if there is no historyId yet or Gmail no
+        longer keeps history that far back (HTTP 404).
+        """
+        if self.history_id is None:
+            print("[GmailWatcher] No sync state yet, running full sync")
+            return self._full_resync()
+
+        msg_ids = []
+        page_token = None
+        try:
+            while True:
+                response = self.service.users().history().list(
+                    userId="me",
+                    startHistoryId=self.history_id,
+                    historyTypes=["messageAdded", "labelAdded"],
+                    pageToken=page_token,
+                ).execute()
+
+                for record in response.get("history", []):
+                    changes = record.get("messagesAdded", []) + record.get("labelsAdded", [])
+                    for change in changes:
+                        message = change["message"]
+                        labels = set(message.get("labelIds", REQUIRED_LABELS))
+                        if REQUIRED_LABELS <= labels:
+                            msg_ids.append(message["id"])
+
+                page_token = response.get("nextPageToken")
+                if not page_token:
+                    break
+        except HttpError as e:
+            if e.resp.status == 404:
+                print("[GmailWatcher] History expired, running full resync")
+                return self._full_resync()
+            raise
+
+        self._next_history_id = response.get("historyId", self.history_id)
+        return list(dict.fromkeys(msg_ids))
+
+    def _email_from_message(self, message: dict) -> dict:
+        """Parse and classify a fetched message."""
+        email_data = self._parse_email(message)
+        email_data["priority"] = self._classify_priority(
+            email_data["subject"],
+            email_data["body"],
+        )
+        print(
+            f"[GmailWatcher] New email: {email_data['subject'][:50]}... "
+            f"({PRIORITY_EMOJI[email_data['priority']]} {email_data['priority']})"
+        )
+        return email_data
+
     def check_for_updates(self) -> list:
         """Check Gmail for unread important emails."""
         self._init_service()
 
         try:
-            # Query for unread important emails
-            results = self.service.users().messages().list(
-                userId="me",
-                q="is:unread is:important",
-                maxResults=20,
-            ).execute()
-
-            messages = results.get("messages", [])
-
-            if not messages:
+            if self.incremental:
+                msg_ids = self._list_history()
+            else:
+                msg_ids = self._list_query()
+
+            # Skip already processed
+            msg_ids = [msg_id for msg_id in msg_ids if msg_id not in self.processed_ids]
+            if not msg_ids:
                 return []
 
-            new_emails = []
+            messages, errors = self.client.get_messages(msg_ids, format="full")
+            for msg_id, error in errors.items():
+                print(f"[GmailWatcher] Could not fetch message {msg_id}: {error}")
+            if errors:
+                # Failed messages are retried next cycle, so keep their history window
+                self._next_history_id = None
 
-            for msg_ref in messages:
-                msg_id = msg_ref["id"]
+            new_emails = []
 
-                # Skip already processed
-                if msg_id in self.processed_ids:
+            for message in messages:
+                # History reports every new message; keep the query's semantics
+                if self.incremental and not REQUIRED_LABELS <= set(message.get("labelIds", [])):
                     continue
 
-                # Fetch full message
-                message = self.service.users().messages().get(
-                    userId="me",
-                    id=msg_id,
-                    format="full",
-                ).execute()
-
-                email_data = self._parse_email(message)
-                email_data["priority"] = self._classify_priority(
-                    email_data["subject"],
-                    email_data["body"],
-                )
-
-                new_emails.append(email_data)
-                print(
-                    f"[GmailWatcher] New email: {email_data['subject'][:50]}... "
-                    f"({PRIORITY_EMOJI[email_data['priority']]} {email_data['priority']})"
-                )
+                new_emails.append(self._email_from_message(message))
 
             return new_emails
 
         except Exception as e:
-            print(f"[GmailWatcher] Error checking emails: {e}")
-            return []
+            # Retry the same history window next time; run() backs off
+            self._next_history_id = None
+            raise RuntimeError(f"Error checking emails: {e}") from e
+
+    def _fetch_chunk(self, msg_ids: list[str]) -> tuple[list[dict], dict]:
+        """Fetch one batch of messages on a backfill worker thread."""
+        return self.client.get_messages(msg_ids, format="full", retries=BACKFILL_RETRIES)
+
+    def _load_backfill_checkpoint(self) -> dict:
+        """Load the checkpoint of an interrupted backfill, if any."""
+        if self.backfill_file.exists():
+            try:
+                with open(self.backfill_file, "r") as f:
+                    checkpoint = json.load(f)
+                if checkpoint.get("query") == GMAIL_QUERY:
+                    return checkpoint
+            except (json.JSONDecodeError, IOError) as e:
+                print(f"[GmailWatcher] Warning: Could not load backfill checkpoint: {e}")
+        return {}
+
+    def _save_backfill_checkpoint(self, checkpoint: dict):
+        """Record backfill progress after a completed page."""
+        if self.dry_run:
+            return
+        checkpoint["last_updated"] = datetime.now().isoformat()
+        tmp_file = self.backfill_file.with_suffix(".tmp")
+        try:
+            with open(tmp_file, "w") as f:
+                json.dump(checkpoint, f, indent=2)
+            tmp_file.replace(self.backfill_file)
+        except IOError as e:
+            print(f"[GmailWatcher] Warning: Could not save backfill checkpoint: {e}")
+
+    def backfill(self) -> int:
+        """
+        Ingest every email matching the watch query, page by page.
+
+        Each page's messages are fetched as parallel batch requests, with
+        rate-limited and 5xx responses retried with backoff. The page cursor
+        is checkpointed after each completed page, so an interrupted backfill
+        resumes where it stopped. Returns the number of emails ingested.
+        """
+        self._init_service()
+
+        checkpoint = self._load_backfill_checkpoint() or {"query": GMAIL_QUERY, "pages": 0, "created": 0}
+        if checkpoint.get("page_token"):
+            print(f"[GmailWatcher] Resuming backfill after page {checkpoint['pages']}")
+        else:
+            print("[GmailWatcher] Starting backfill...")
+
+        # Incremental sync continues from where the backfill started
+        if self.incremental and self.history_id is None:
+            if "history_id" not in checkpoint:
+                profile = execute_with_backoff(self.service.users().getProfile(userId="me"))
+                checkpoint["history_id"] = profile["historyId"]
+            self._next_history_id = checkpoint["history_id"]
+
+        try:
+            with ThreadPoolExecutor(max_workers=BACKFILL_CONCURRENCY) as pool:
+                while True:
+                    response = execute_with_backoff(
+                        self.service.users().messages().list(
+                            userId="me",
+                            q=GMAIL_QUERY,
+                            maxResults=BACKFILL_PAGE_SIZE,
+                            pageToken=checkpoint.get("page_token"),
+                        ),
+                        BACKFILL_RETRIES,
+                    )
+
+                    msg_ids = [
+                        msg_ref["id"]
+                        for msg_ref in response.get("messages", [])
+                        if msg_ref["id"] not in self.processed_ids
+                    ]
+                    chunks = [msg_ids[i:i + BATCH_LIMIT] for i in range(0, len(msg_ids), BATCH_LIMIT)]
+
+                    retry_later = []
+                    for messages, errors in pool.map(self._fetch_chunk, chunks):
+                        for msg_id, error in errors.items():
+                            print(f"[GmailWatcher] Could not fetch message {msg_id}: {error}")
+                            if is_retryable(error):
+                                retry_later.append(msg_id)
+                        for message in messages:
+                            self.create_action_file(self._email_from_message(message))
+                            checkpoint["created"] += 1
+
+                    self._save_processed_ids()
+                    self._save_attachment_index()
+
+                    if retry_later:
+                        # Leave the cursor on this page so the next run picks these up
+                        self._save_backfill_checkpoint(checkpoint)
+                        raise RuntimeError(
+                            f"Gmail is still rate limiting {len(retry_later)} message(s) "
+                            f"on page {checkpoint['pages'] + 1}"
+                        )
+
+                    checkpoint["pages"] += 1
+                    checkpoint["page_token"] = response.get("nextPageToken")
+                    print(
+                        f"[GmailWatcher] Backfill page {checkpoint['pages']}: "
+                        f"{len(msg_ids)} new email(s)"
+                    )
+                    if not checkpoint["page_token"]:
+                        break
+                    self._save_backfill_checkpoint(checkpoint)
+        finally:
+            # Files created so far must not be recreated on resume
+            self._save_processed_ids()
+            self._save_attachment_index()
+
+        if not self.dry_run:
+            self.backfill_file.unlink(missing_ok=True)
+        self._save_history_id()
+
+        print(
+            f"[GmailWatcher] Backfill complete: {checkpoint['created']} email(s) "
+            f"in {checkpoint['pages']} page(s)"
+        )
+        return checkpoint["created"]
+
+    def _attachment_path(self, filename: str) -> Path:
+        """A free path in attachments_dir for an attachment's file name."""
+        name = re.sub(r"[^\w .-]", "_", Path(filename).name).lstrip(". ") or "attachment"
+        stem, suffix = os.path.splitext(name)
+        path = self.attachments_dir / name
+        counter = 1
+        while path.exists():
+            path = self.attachments_dir / f"{stem}_{counter}{suffix}"
+            counter += 1
+        return path
+
+    def _download_attachment(self, msg_id: str, attachment: dict) -> Path:
+        """
+        Stream one attachment to disk and return where it is stored.
+
+        Data is written to a hidden ".<random>.part" file in attachments_dir
+        while it is hashed, then renamed into place, so the file watcher
+        (which ignores hidden files) only ever sees complete files. If the
+        same content was saved before, the earlier copy is returned instead.
+        """
+        self.attachments_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=".", suffix=".part", dir=self.attachments_dir)
+        try:
+            with os.fdopen(fd, "wb") as out:
+                if attachment["attachment_id"]:
+                    digest, _ = self.client.download_attachment(
+                        msg_id, attachment["attachment_id"], out, self.attachment_max_bytes
+                    )
+                else:
+                    data = attachment["data"].encode()
+                    chunks = (data[i:i + DOWNLOAD_CHUNK] for i in range(0, len(data), DOWNLOAD_CHUNK))
+                    digest, _ = stream_base64(chunks, out, self.attachment_max_bytes)
+
+            existing = self.attachment_index.get(digest)
+            if existing and Path(existing).exists():
+                print(f"[GmailWatcher] Attachment {attachment['filename']} already saved as {Path(existing).name}")
+                return Path(existing)
+
+            dest = self._attachment_path(attachment["filename"])
+            os.replace(tmp_name, dest)
+            self.attachment_index.add(digest, str(dest))
+            print(f"[GmailWatcher] Saved attachment: {dest.name}")
+            return dest
+        finally:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+
+    def _save_attachments(self, item: dict) -> list[str]:
+        """Save an email's attachments (if enabled) and return Markdown list lines."""
+        lines = []
+        for attachment in item.get("attachments", []):
+            name = attachment["filename"]
+            size = f"{attachment['size'] / 1024:.1f} KB"
+
+            if self.attachments_dir is None:
+                lines.append(f"- {name} ({size})")
+                continue
+            if attachment["size"] > self.attachment_max_bytes:
+                lines.append(f"- {name} ({size}) - not saved, over {self.attachment_max_bytes // (1024 * 1024)} MB")
+                continue
+            if self.dry_run:
+                lines.append(f"- {name} ({size}) - would be saved to {self.attachments_dir}")
+                continue
+
+            try:
+                path = self._download_attachment(item["id"], attachment)
+                lines.append(f"- [{name}]({path.as_uri()}) ({size})")
+            except AttachmentTooLarge:
+                lines.append(f"- {name} ({size}) - not saved, over {self.attachment_max_bytes // (1024 * 1024)} MB")
+            except Exception as e:
+                print(f"[GmailWatcher] Could not save attachment {name}: {e}")
+                lines.append(f"- {name} ({size}) - download failed")
+        return lines
 
     def create_action_file(self, item: dict) -> Path:
         """Create an action file in /Needs_Action for the email."""
@@ -265,8 +567,12 @@ class GmailWatcher(BaseWatcher):
 
         filename = f"EMAIL_{safe_subject}_{timestamp}.md"
         filepath = self.needs_action_path / filename
+        if filepath.exists():
+            # Same subject within the same second (common during a backfill)
+            filepath = self.needs_action_path / f"EMAIL_{safe_subject}_{timestamp}_{item['id']}.md"
 
         priority_emoji = PRIORITY_EMOJI.get(item["priority"], "🟢")
+        attachment_lines = self._save_attachments(item)
 
         content = f"""---
 type: email
@@ -289,7 +595,11 @@ status: pending
 
 {item['body']}
 
-## Suggested Actions
+"""
+        if attachment_lines:
+            content += "## Attachments\n\n" + "\n".join(attachment_lines) + "\n\n"
+
+        content += """## Suggested Actions
 
 - [ ] Reply to sender
 - [ ] Forward to relevant party
@@ -305,43 +615,56 @@ status: pending
             filepath.write_text(content, encoding="utf-8")
             print(f"[GmailWatcher] Created: {filepath.name}")
 
-        # Mark as processed
+        # Mark as processed (persisted at the end of the cycle)
         self.processed_ids.add(item["id"])
-        self._save_processed_ids()
 
         return filepath
 
-    def run(self):
-        """Main loop with custom check interval."""
-        self.running = True
-        print(f"[GmailWatcher] Starting watcher...")
-        print(f"[GmailWatcher] Check interval: {self.check_interval}s")
+    def on_start(self):
+        """Report settings and start the push endpoint, if enabled."""
+        print(f"[GmailWatcher] Check interval: {self.check_interval}s "
+              f"(adapts between {self.min_interval:.0f}s and {self.max_interval:.0f}s)")
         print(f"[GmailWatcher] Vault path: {self.vault_path}")
         print(f"[GmailWatcher] Dry run: {self.dry_run}")
+        print(f"[GmailWatcher] Sync mode: {'incremental' if self.incremental else 'query'}")
         print(f"[GmailWatcher] Previously processed: {len(self.processed_ids)} emails")
 
-        while self.running:
-            try:
-                print(f"\n[GmailWatcher] Checking for new emails... ({datetime.now().strftime('%H:%M:%S')})")
-                items = self.check_for_updates()
-
-                if items:
-                    print(f"[GmailWatcher] Found {len(items)} new email(s)")
-                    for item in items:
-                        self.create_action_file(item)
-                else:
-                    print("[GmailWatcher] No new emails")
+        if self.push_port is not None:
+            self._receiver = PushReceiver(
+                self.notify,
+                host=self.push_host,
+                port=self.push_port,
+                token=self.push_token,
+            )
+            self._receiver.start()
+
+    def poll_once(self) -> int:
+        """Check for new emails, create their action files and save sync state."""
+        if self.watch_topic and time.time() >= self._watch_renew_at:
+            self._register_watch()
+
+        print(f"\n[GmailWatcher] Checking for new emails... ({datetime.now().strftime('%H:%M:%S')})")
+        items = self.check_for_updates()
+
+        if items:
+            print(f"[GmailWatcher] Found {len(items)} new email(s)")
+            for item in items:
+                self.create_action_file(item)
+        else:
+            print("[GmailWatcher] No new emails")
 
-                # Wait for next check
-                time.sleep(self.check_interval)
+        self._save_processed_ids()
+        self._save_attachment_index()
+        self._save_history_id()
+        return len(items)
 
-            except KeyboardInterrupt:
-                print(f"\n[GmailWatcher] Stopping watcher...")
-                self.running = False
-                break
-            except Exception as e:
-                print(f"[GmailWatcher] Error: {e}")
-                time.sleep(30)  # Wait before retry on error
+    def on_stop(self):
+        """Persist processed IDs and attachment hashes and stop the push endpoint."""
+        self._save_processed_ids()
+        self._save_attachment_index()
+        if self._receiver is not None:
+            self._receiver.stop()
+            self._receiver = None
 
 
 def main():
@@ -371,6 +694,63 @@ def main():
         default=120,
         help="Check interval in seconds (default: 120)",
     )
+    parser.add_argument(
+        "--backfill",
+        action="store_true",
+        help="Ingest every matching email (all pages) before watching; resumes if interrupted",
+    )
+    parser.add_argument(
+        "--min-interval",
+        type=float,
+        default=None,
+        help="Shortest check interval while emails keep arriving (default: interval / 4)",
+    )
+    parser.add_argument(
+        "--max-interval",
+        type=float,
+        default=None,
+        help="Longest check interval when the mailbox is idle (default: interval * 3)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Fetch only mailbox changes via the History API instead of re-querying",
+    )
+
+    parser.add_argument(
+        "--push-port",
+        type=int,
+        default=None,
+        help="Accept Gmail push notifications on this port and fetch as soon as one arrives",
+    )
+    parser.add_argument(
+        "--push-host",
+        default=DEFAULT_HOST,
+        help=f"Address for the push endpoint (default: {DEFAULT_HOST})",
+    )
+    parser.add_argument(
+        "--push-token",
+        default=None,
+        help="Shared secret the push subscription sends as ?token=",
+    )
+    parser.add_argument(
+        "--watch-topic",
+        default=None,
+        help="Pub/Sub topic (projects/<id>/topics/<name>) to register with Gmail's watch API",
+    )
+
+    parser.add_argument(
+        "--attachments-dir",
+        type=Path,
+        default=None,
+        help="Save email attachments here (e.g. the file watcher's drop folder); off by default",
+    )
+    parser.add_argument(
+        "--attachment-max-mb",
+        type=int,
+        default=ATTACHMENT_MAX_MB,
+        help=f"Skip attachments larger than this (default: {ATTACHMENT_MAX_MB})",
+    )
 
     args = parser.parse_args()
 
@@ -387,8 +767,27 @@ def main():
         credentials_path=credentials_path,
         dry_run=args.dry_run,
         check_interval=args.interval,
+        min_interval=args.min_interval,
+        max_interval=args.max_interval,
+        incremental=args.incremental,
+        push_port=args.push_port,
+        push_host=args.push_host,
+        push_token=args.push_token,
+        watch_topic=args.watch_topic,
+        attachments_dir=args.attachments_dir,
+        attachment_max_mb=args.attachment_max_mb,
     )
 
+    if args.backfill:
+        try:
+            watcher.backfill()
+        except KeyboardInterrupt:
+            print("\n[GmailWatcher] Backfill interrupted, rerun with --backfill to resume")
+            return
+        except Exception as e:
+            print(f"[GmailWatcher] Backfill stopped: {e}")
+            print("[GmailWatcher] Rerun with --backfill to resume from the last page")
+
     watcher.run()
 
 